@@ -1,5 +1,37 @@
-from . import (drivers, enums, input_schema, io, physics, randomisation,
-               settings, state, status, utils)
-from .deposition import Deposition
-from .iteration import Iteration
-from .settings import Settings
+import importlib
+
+# submodules and classes are imported on first access to keep start up fast
+_submodules = (
+    "drivers",
+    "enums",
+    "input_schema",
+    "io",
+    "physics",
+    "randomisation",
+    "settings",
+    "state",
+    "status",
+    "utils",
+)
+
+_classes = {
+    "Deposition": ".deposition",
+    "Iteration": ".iteration",
+    "Settings": ".settings",
+}
+
+__all__ = list(_submodules) + list(_classes)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _classes:
+        value = getattr(importlib.import_module(_classes[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
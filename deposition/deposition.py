@@ -1,7 +1,10 @@
+import time
+
 from deposition import io, utils
 from deposition.enums import DirectoriesEnum
 from deposition.iteration import Iteration
 from deposition.settings import Settings
+from deposition.state import State
 from deposition.status import Status
 
 
@@ -17,6 +20,7 @@ class Deposition:
     """
 
     _status_file = "status.yaml"
+    _status_write_max_seconds = 300.0
     _initial_positions_pickle = "initial_positions.pickle"
 
     def __init__(self, settings):
@@ -25,10 +29,13 @@ class Deposition:
         of the deposition calculation from the status file if it is present.
 
         Arguments:
-            settings (dict): deposition settings (read with
-            `deposition.utils.read_settings_from_file()`)
+            settings (Settings or dict): deposition settings (read with
+            `deposition.settings.Settings.from_file()`)
         """
-        self.settings = Settings(settings)
+        if isinstance(settings, Settings):
+            self.settings = settings
+        else:
+            self.settings = Settings(settings)
         io.start_logging(self.settings.log_filename)
 
         try:
@@ -62,25 +69,50 @@ class Deposition:
 
     def run(self):
         """
-        Executes the main deposition loop using the :class:`Iteration` class.
+        Executes the main deposition loop using the :class:`Iteration` class. The status
+        file is written every `status_write_interval` iterations, or after
+        `_status_write_max_seconds` have elapsed, and always when the loop terminates.
 
         Returns:
             exit_code (int): a code relating to the reason for the termination of the
         """
+        iterations_since_write = 0
+        last_write_time = time.monotonic()
+        state = None
+
+        try:
+            while True:
+                iteration = Iteration(self.driver, self.settings, self.status, state)
+                success, self.status.pickle_location = iteration.run()
+
+                if success:
+                    # keep the saved state in memory rather than reading it back
+                    state = State(
+                        iteration.state.coordinates, iteration.state.elements, None
+                    )
+                    self.status.sequential_failures = 0
+                else:
+                    self.status.sequential_failures += 1
+                    self.status.total_failures += 1
+                self.status.iteration_number += 1
+
+                iterations_since_write += 1
+                if (
+                    iterations_since_write >= self.settings.status_write_interval
+                    or time.monotonic() - last_write_time
+                    >= self._status_write_max_seconds
+                ):
+                    self.status.write(self._status_file)
+                    iterations_since_write = 0
+                    last_write_time = time.monotonic()
 
-        while True:
-            iteration = Iteration(self.driver, self.settings, self.status)
-            success, self.status.pickle_location = iteration.run()
-
-            if success:
-                self.status.sequential_failures = 0
-            else:
-                self.status.sequential_failures += 1
-                self.status.total_failures += 1
-            self.status.iteration_number += 1
-            self.status.write(self._status_file)
-
-            if self.status.iteration_number > self.settings.max_total_iterations:
-                return 0  # exceeded maximum iterations
-            if self.status.sequential_failures > self.settings.max_sequential_failures:
-                return 1  # exceeded maximum failures
+                if self.status.iteration_number > self.settings.max_total_iterations:
+                    return 0  # exceeded maximum iterations
+                if (
+                    self.status.sequential_failures
+                    > self.settings.max_sequential_failures
+                ):
+                    return 1  # exceeded maximum failures
+        finally:
+            if iterations_since_write > 0:
+                self.status.write(self._status_file)
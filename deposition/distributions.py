@@ -64,32 +64,124 @@ class FixedPositionDistribution:
         self.z = z
         self.x = float(arguments[0])
         self.y = float(arguments[1])
+        self._position = (self.x, self.y, float(self.z))
+        self._position_array = np.array(self._position)
+        self._position_array.setflags(write=False)
 
     def get_position(self):
-        return self.x, self.y, self.z
+        return self._position
+
+    def prefill(self, num_positions):
+        return np.broadcast_to(self._position_array, (num_positions, 3))
 
 
 class UniformPositionDistribution:
-    """Returns a uniformly random position within the polygon"""
+    """
+    Returns a uniformly random position within the polygon. Convex polygons, such as
+    the cross-section of the simulation cell, are sampled directly by splitting them
+    into triangles. Other polygons fall back to rejection sampling.
+    """
 
     num_arguments = 0
     _max_iterations = 10000
+    _batch_size = 256
 
     def __init__(self, polygon_coordinates, z, arguments=None):
         self.polygon_coordinates = polygon_coordinates
         self.z = z
+        self._triangles = None
+        if polygon_coordinates is not None:
+            self._polygon = mplpath.Path(polygon_coordinates)
+            bbox = self._polygon.get_extents()
+            self._lower_bounds = bbox.min
+            self._upper_bounds = bbox.max
+            triangulation = _convex_fan_triangulation(polygon_coordinates)
+            if triangulation is not None:
+                self._triangles, self._cumulative_areas = triangulation
 
     def get_position(self):
-        polygon = mplpath.Path(self.polygon_coordinates)
-        bbox = polygon.get_extents()
-        for iteration in range(self._max_iterations):
-            point = (
-                np.random.uniform(bbox.xmin, bbox.xmax),
-                np.random.uniform(bbox.ymin, bbox.ymax),
+        x, y, z = self.prefill(1)[0]
+        return float(x), float(y), float(z)
+
+    def prefill(self, num_positions):
+        positions = np.empty((num_positions, 3))
+        if self._triangles is not None:
+            positions[:, :2] = self._sample_triangles(num_positions)
+        else:
+            positions[:, :2] = self._sample_by_rejection(num_positions)
+        positions[:, 2] = self.z
+        return positions
+
+    def _sample_triangles(self, num_positions):
+        # choose triangles weighted by area, then a uniform point in each
+        triangle_indices = np.searchsorted(
+            self._cumulative_areas, physics.rng.random(num_positions), side="right"
+        )
+        triangle_indices = np.minimum(triangle_indices, len(self._triangles) - 1)
+        a, b, c = np.moveaxis(self._triangles[triangle_indices], 1, 0)
+        u1, u2 = physics.rng.random((2, num_positions, 1))
+        s = np.sqrt(u1)
+        return (1 - s) * a + s * (1 - u2) * b + s * u2 * c
+
+    def _sample_by_rejection(self, num_positions):
+        num_candidates = max(4 * num_positions, self._batch_size)
+        accepted = []
+        num_accepted = 0
+        max_candidates = self._max_iterations * num_positions
+        for iteration in range(0, max_candidates, num_candidates):
+            points = physics.rng.uniform(
+                self._lower_bounds, self._upper_bounds, (num_candidates, 2)
             )
-            if polygon.contains_point(point):
-                return point[0], point[1], self.z
-        raise RuntimeError("generation of random position failed")
+            accepted.append(points[self._polygon.contains_points(points)])
+            num_accepted += len(accepted[-1])
+            if num_accepted >= num_positions:
+                return np.concatenate(accepted)[:num_positions]
+        raise RuntimeError("generation of random positions failed")
+
+
+def _convex_fan_triangulation(polygon_coordinates):
+    """
+    Splits a convex polygon into triangles which share its first vertex. A polygon is
+    only treated as convex if it turns the same way at every vertex and turns once
+    around in total.
+
+    Arguments:
+        polygon_coordinates (np.array): xy-coordinates of the polygon vertices
+
+    Returns:
+        triangles (np.array): vertices of each triangle, shape (T, 3, 2)
+        cumulative_areas (np.array): cumulative fraction of the polygon area
+        or None if the polygon is not convex, is self-intersecting, or has no area
+    """
+
+    def cross(u, v):
+        return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+
+    vertices = np.asarray(polygon_coordinates, dtype=float)
+    edges = np.roll(vertices, -1, axis=0) - vertices
+    following_edges = np.roll(edges, -1, axis=0)
+    turns = cross(edges, following_edges)
+    if len(vertices) < 3 or not (np.all(turns >= 0) or np.all(turns <= 0)):
+        return None
+    # turning the same way at every vertex also allows self-intersecting polygons,
+    # such as a star, which turn more than once around
+    dots = (edges * following_edges).sum(axis=-1)
+    total_turning = np.arctan2(turns, dots).sum()
+    if not np.isclose(abs(total_turning), 2 * np.pi):
+        return None
+
+    num_triangles = len(vertices) - 2
+    triangles = np.empty((num_triangles, 3, 2))
+    triangles[:, 0] = vertices[0]
+    triangles[:, 1] = vertices[1:-1]
+    triangles[:, 2] = vertices[2:]
+    areas = 0.5 * np.abs(
+        cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    )
+    total_area = areas.sum()
+    if total_area == 0:
+        return None
+    return triangles, np.cumsum(areas) / total_area
 
 
 """Velocity distribution classes"""
@@ -110,9 +202,15 @@ class FixedVelocityDistribution:
         self.vx = float(arguments[0])
         self.vy = float(arguments[1])
         self.vz = float(arguments[2])
+        self._velocity = (self.vx, self.vy, self.vz)
+        self._velocity_array = np.array(self._velocity)
+        self._velocity_array.setflags(write=False)
 
     def get_velocity(self):
-        return self.vx, self.vy, self.vz
+        return self._velocity
+
+    def prefill(self, num_velocities):
+        return np.broadcast_to(self._velocity_array, (num_velocities, 3))
 
 
 class GaussianVelocityDistribution:
@@ -132,20 +230,21 @@ class GaussianVelocityDistribution:
         ), f"{self.__class__} requires {self.num_arguments} argument(s)"
         self.gas_temperature = float(arguments[0])
         self.particle_mass = float(arguments[1])
-        self.mean = arguments = float(arguments[2])
-
-    def get_single_velocity(self):
-        sigma = math.sqrt(
+        self.mean = float(arguments[2])
+        self.sigma = math.sqrt(
             (physics.CONSTANTS["BoltzmannConstant"] * self.gas_temperature)
             / self.particle_mass
         )
-        return np.random.normal(loc=self.mean, scale=sigma)
+
+    def get_single_velocity(self):
+        return self.mean + self.sigma * float(physics.rng.standard_normal())
 
     def get_velocity(self):
-        vx = self.get_single_velocity()
-        vy = self.get_single_velocity()
-        vz = self.get_single_velocity()
-        return vx, vy, vz
+        vx, vy, vz = self.mean + self.sigma * physics.rng.standard_normal(3)
+        return float(vx), float(vy), float(vz)
+
+    def prefill(self, num_velocities):
+        return physics.rng.normal(self.mean, self.sigma, (num_velocities, 3))
 
 
 """Distribution Enums"""
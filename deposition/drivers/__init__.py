@@ -1,3 +1,7 @@
-from .molecular_dynamics_driver import MolecularDynamicsDriver  # isort:skip
+from .molecular_dynamics_driver import (  # isort:skip
+    DRIVER_REGISTRY,
+    MolecularDynamicsDriver,
+    get_driver,
+)
 from .gulp_driver import GULPDriver
 from .lammps_driver import LAMMPSDriver
@@ -1,10 +1,6 @@
 from enum import Enum
 
-import deposition
+from deposition.drivers import DRIVER_REGISTRY
 
-
-class DriverEnum(Enum):
-    "Associate names with specific implemented driver classes"
-
-    LAMMPS = deposition.drivers.lammps_driver.LAMMPSDriver
-    GULP = deposition.drivers.gulp_driver.GULPDriver
+DriverEnum = Enum("DriverEnum", DRIVER_REGISTRY)
+"""Associate names with specific implemented driver classes, generated from the driver registry"""
@@ -1,9 +1,12 @@
+import itertools
+import math
 import os
 
 import numpy as np
 
 from deposition import io, physics
 from deposition.drivers import MolecularDynamicsDriver
+from deposition.input_schema import path_exists
 from deposition.state import State
 
 
@@ -16,8 +19,11 @@ class GULPDriver(MolecularDynamicsDriver):
     inputs which are required when using the GULP driver.
     """
 
+    name = "GULP"
+    """Name used to select this driver in the settings file."""
+
     schema_dict = {
-        "GULP_LIB": os.path.exists,
+        "GULP_LIB": path_exists,
     }
     """
     The names and types of additional inputs for GULP:
@@ -73,32 +79,31 @@ class GULPDriver(MolecularDynamicsDriver):
             iteration_stage (str): either "relaxation" or "deposition"
         """
 
-        def write_positions(filename, coordinates, elements):
+        def write_positions(file, coordinates, elements):
             """
             Write positional data to the GULP input file.
 
             Arguments:
-                filename (str): name to use for input files
+                file (file object): open GULP input file
                 coordinates (np.array): coordinate data
                 elements (list): atomic species data
             """
-            with open(filename, "a") as file:
-                file.write("cartesian\n")
-                for atom, xyz in zip(elements, coordinates):
-                    file.write(f"{atom} {xyz[0]} {xyz[1]}, {xyz[2]}\n")
+            lines = [
+                f"{atom} {xyz[0]} {xyz[1]}, {xyz[2]}\n"
+                for atom, xyz in zip(elements, coordinates)
+            ]
+            file.write("cartesian\n" + "".join(lines))
 
-        def write_velocities(filename, velocities):
+        def write_velocities(file, velocities):
             """
-            Write positional data to the GULP input file.
+            Write velocity data to the GULP input file.
 
             Arguments:
-                filename (str): name to use for input files
+                file (file object): open GULP input file
                 velocities (np.array): velocity data
             """
-            with open(filename, "a") as file:
-                file.write("velocities\n")
-                for ii, v in enumerate(velocities):
-                    file.write(f"{ii} {v[0]} {v[1]} {v[2]}\n")
+            lines = [f"{ii} {v[0]} {v[1]} {v[2]}\n" for ii, v in enumerate(velocities)]
+            file.write("velocities\n" + "".join(lines))
 
         def parameters_from_simulation_cell(simulation_cell):
             """
@@ -133,40 +138,36 @@ class GULPDriver(MolecularDynamicsDriver):
             self.simulation_cell
         )
 
-        template_values = self.settings
+        template_values = {
+            **self.settings,
+            "filename": filename,
+            "thermostat_damping": thermostat_damping,
+            "x_size": x_size,
+            "y_size": y_size,
+            "z_size": z_size,
+            "alpha": alpha,
+            "beta": beta,
+            "gamma": gamma,
+        }
 
         if iteration_stage == "relaxation":
-            template_values.update(
-                {
-                    "production_time_picoseconds": self.settings[
-                        "relaxation_time_picoseconds"
-                    ]
-                }
-            )
+            template_values["production_time_picoseconds"] = self.settings[
+                "relaxation_time_picoseconds"
+            ]
         elif iteration_stage == "deposition":
-            template_values.update(
-                {
-                    "production_time_picoseconds": self.settings[
-                        "deposition_time_picoseconds"
-                    ]
-                }
+            template_values["production_time_picoseconds"] = self.settings[
+                "deposition_time_picoseconds"
+            ]
+
+        with open(input_filename, "w") as file:
+            file.write(
+                io.render_template(
+                    self.settings["path_to_input_template"], template_values
+                )
             )
-
-        template_values.update({"filename": filename})
-        template_values.update({"thermostat_damping": thermostat_damping})
-        template_values.update({"x_size": x_size})
-        template_values.update({"y_size": y_size})
-        template_values.update({"z_size": z_size})
-        template_values.update({"alpha": alpha})
-        template_values.update({"beta": beta})
-        template_values.update({"gamma": gamma})
-
-        io.write_file_using_template(
-            input_filename, self.settings["path_to_input_template"], template_values
-        )
-        write_positions(input_filename, state.coordinates, state.elements)
-        if iteration_stage == "deposition":
-            write_velocities(input_filename, state.velocities)
+            write_positions(file, state.coordinates, state.elements)
+            if iteration_stage == "deposition":
+                write_velocities(file, state.velocities)
 
     @staticmethod
     def get_thermostat_damping(num_atoms, temperature=300.0):
@@ -188,7 +189,7 @@ class GULPDriver(MolecularDynamicsDriver):
         a = 610.0
         b = -49.6
         canonical_variance = physics.get_canonical_variance(num_atoms, temperature)
-        nose_hoover = (np.log(canonical_variance) - np.log(a)) / b
+        nose_hoover = (math.log(canonical_variance) - math.log(a)) / b
         return max(round(nose_hoover, 6), minimum_nose_hoover_parameter)
 
     @staticmethod
@@ -203,77 +204,36 @@ class GULPDriver(MolecularDynamicsDriver):
             state: coordinates, elements, velocities
         """
 
-        def get_data_types(trajectory_file):
-            """
-            Assess the type of data contained in the trajectory file.
-
-            Arguments:
-                trajectory_file (path): GULP trajectory (.trj) file containing position, velocity, and other data
-
-            Returns:
-                list_of_data_types (list): types of data in the file, e.g. Coordinates, Velocities, Charges, etc.
-            """
-            list_of_data_types = list()
-            with open(trajectory_file) as file:
-                for line in file:
-                    if line.startswith("#") and "Time" not in line:
-                        data_type = line.strip("#").strip()
-                        if data_type in list_of_data_types:
-                            break
-                        else:
-                            list_of_data_types.append(data_type)
-            return list_of_data_types
-
         def get_data_from_trajectory_file(trajectory_file, data_type, step_number=None):
             """
-            Read data from the trajectory file.
+            Read data from the trajectory file in a single pass.
 
             Arguments:
-                trajectory_file (path): GULP trajectory (.trj) file containing position, velocity, and other data
+                trajectory_file (path): GULP trajectory (.trg) file containing position, velocity, and other data
                 data_type (str): type of data to read, e.g. Coordinates, Velocities, Charges, etc.
-                step_number (int or None): which step of the file to read from
+                step_number (int or None): which step of the file to read from, the last step when None
 
             Returns:
                 data (np.array): data read from the file of the given type at the given step
             """
-            available_types = get_data_types(trajectory_file)
-            if data_type not in available_types:
-                raise ValueError(f"data type {data_type} not present")
-
+            block = None
+            num_blocks_read = 0
             with open(trajectory_file) as file:
                 _ = file.readline()
-                num_atoms_str, _ = file.readline().split()
-                num_atoms = int(num_atoms_str)
+                num_atoms = int(file.readline().split()[0])
+                for line in file:
+                    if line.startswith("#") and line.strip("#").strip() == data_type:
+                        block = list(itertools.islice(file, num_atoms))
+                        num_blocks_read += 1
+                        if num_blocks_read == step_number:
+                            break
 
-            num_header_lines = 2
-            num_lines_per_step = num_header_lines + (
-                len(available_types) * (num_atoms + 1)
-            )
-            num_lines_in_file = sum(1 for _ in open(trajectory_file))
-            num_steps = (num_lines_in_file - num_header_lines) / num_lines_per_step
-            if step_number is None:
-                step_number = num_steps
-            num_lines_to_skip = int(
-                num_header_lines + (num_lines_per_step * (step_number - 1))
-            )
+            if block is None:
+                raise ValueError(f"data type {data_type} not present")
+            if step_number is not None and num_blocks_read != step_number:
+                raise ValueError(f"step {step_number} not present in {trajectory_file}")
+            return np.loadtxt(block, ndmin=2)
 
-            with open(trajectory_file) as file:
-                io.throw_away_lines(file, num_lines_to_skip)
-                for line in file:
-                    if line.strip("#").strip() == data_type:
-                        break
-                data = np.empty((num_atoms, 3))
-                data.fill(np.nan)
-                for ii in range(num_atoms):
-                    atom_data = file.readline().split()
-                    for jj, value in enumerate(atom_data):
-                        data[ii, jj] = value
-
-            data = data[
-                :, ~np.isnan(data).all(axis=0)
-            ]  # delete redundant columns of NaN values
-            return data
-
-        coordinates, elements, _ = io.read_xyz(f"{filename}.xyz")
+        state = io.read_xyz(f"{filename}.xyz")
         velocities = get_data_from_trajectory_file(f"{filename}.trg", "Velocities")
-        return State(coordinates, elements, velocities)
+        return State(state.coordinates, state.elements, velocities)
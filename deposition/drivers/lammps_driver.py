@@ -1,6 +1,4 @@
 import numpy as np
-import pandas as pd
-from pymatgen.io.lammps.data import LammpsData
 from schema import And, Optional, Or, Use
 
 from deposition import input_schema, io
@@ -18,6 +16,9 @@ class LAMMPSDriver(MolecularDynamicsDriver):
     inputs which are required when using the LAMMPS driver.
     """
 
+    name = "LAMMPS"
+    """Name used to select this driver in the settings file."""
+
     schema_dict = {
         "atomic_masses": list,  # list of int/floats
         "elements_in_potential": str,  # list of strings
@@ -45,6 +46,11 @@ class LAMMPSDriver(MolecularDynamicsDriver):
     - num_steps (int): the total number of steps in the calculation (total time / timestep)
     """
 
+    _stage_times = {
+        "relaxation": "relaxation_time_picoseconds",
+        "deposition": "deposition_time_picoseconds",
+    }
+
     command = "${prefix} ${binary} ${arguments} -in ${input_file} > ${output_file}"
     """Template used when calling LAMMPS subprocesses."""
 
@@ -56,6 +62,27 @@ class LAMMPSDriver(MolecularDynamicsDriver):
             schema_dict=self.schema_dict,
             reserved_keywords=self.reserved_keywords,
         )
+        # + 1 because LAMMPS atom types start from one
+        self.element_types = {
+            element: index + 1
+            for index, element in enumerate(
+                self.settings["elements_in_potential"].split()
+            )
+        }
+
+    def get_num_steps(self, iteration_stage):
+        """
+        Calculate the number of LAMMPS steps required to simulate an iteration stage.
+
+        Arguments:
+            iteration_stage (str): either "relaxation" or "deposition"
+
+        Returns:
+            num_steps (int): the total time of the stage divided by the timestep
+        """
+        simulation_time = self.settings[self._stage_times[iteration_stage]]
+        scaling = self.settings["timestep_scaling_from_picoseconds"]
+        return int(simulation_time * scaling)
 
     def write_inputs(self, filename, state, iteration_stage):
         """
@@ -69,74 +96,55 @@ class LAMMPSDriver(MolecularDynamicsDriver):
         input_filename = f"{filename}.input"
         input_data_filename = f"{filename}.input_data"
 
-        template_values = self.settings.copy()
-        scaling = self.settings["timestep_scaling_from_picoseconds"]
-
-        if iteration_stage == "relaxation":
-            relaxation_num_steps = (
-                self.settings["relaxation_time_picoseconds"] * scaling
-            )
-            template_values.update({"num_steps": int(relaxation_num_steps)})
-        elif iteration_stage == "deposition":
-            deposition_num_steps = (
-                self.settings["deposition_time_picoseconds"] * scaling
-            )
-            template_values.update({"num_steps": int(deposition_num_steps)})
-
         # Write input file using template
-        template_values.update({"filename": filename})
-        template_values.update(
-            {"elements_in_potential": self.settings["elements_in_potential"]}
-        )
+        template_values = {
+            **self.settings,
+            "filename": filename,
+            "num_steps": self.get_num_steps(iteration_stage),
+        }
 
         io.write_file_using_template(
             input_filename, self.settings["path_to_input_template"], template_values
         )
 
-        # Convert from string labels to number labels where required, + 1 because of zero-indexing
-        list_of_elements_in_potential = self.settings["elements_in_potential"].split()
-        for element_index, element in enumerate(state.elements):
-            if element in list_of_elements_in_potential:
-                state.elements[element_index] = (
-                    list_of_elements_in_potential.index(element) + 1
-                )
-        element_integers = [int(element) for element in state.elements]
-
-        # Set up indices for pandas dataframes
-        atom_indices = range(1, len(state.elements) + 1)
-        mass_indices = range(1, len(self.settings["atomic_masses"]) + 1)
-
-        # Create LammpsData object from system information
-        masses_dataframe = pd.DataFrame(
-            self.settings["atomic_masses"], index=mass_indices, columns=["mass"]
-        )
-        charges_dataframe = pd.DataFrame(
-            np.zeros(((len(state.elements)), 1)), index=atom_indices, columns=["q"]
-        )
-        elements_dataframe = pd.DataFrame(
-            element_integers, index=atom_indices, columns=["type"]
-        )
-        coordinates_dataframe = pd.DataFrame(
-            state.coordinates, index=atom_indices, columns=["x", "y", "z"]
-        )
-        combined_atomic_dataframe = pd.concat(
-            (elements_dataframe, charges_dataframe, coordinates_dataframe), axis=1
+        # Convert from string labels to number labels where required
+        element_integers = np.fromiter(
+            (self.element_types.get(element, element) for element in state.elements),
+            dtype=np.int32,
+            count=len(state.elements),
         )
 
-        lammps_data_object = LammpsData(
-            self.simulation_cell["lammps_box"],
-            masses_dataframe,
-            combined_atomic_dataframe,
-            atom_style="charge",
-        )
+        # Write system data in the LAMMPS data file format for the charge atom style
+        num_atoms = len(state.elements)
+        masses = self.settings["atomic_masses"]
+        atom_ids = np.arange(1, num_atoms + 1)
+        atoms = np.empty((num_atoms, 6))
+        atoms[:, 0] = atom_ids
+        atoms[:, 1] = element_integers
+        atoms[:, 2] = 0.0  # charges are assigned by the potential
+        atoms[:, 3:] = state.coordinates
+        sections = [
+            f"Generated by {__name__}\n\n",
+            f"{num_atoms} atoms\n\n{len(masses)} atom types\n\n",
+            f"{self.simulation_cell['lammps_box']}\n\nMasses\n\n",
+            format_rows(
+                "%d %.6f", np.column_stack((np.arange(1, len(masses) + 1), masses))
+            ),
+            "\nAtoms\n\n",
+            format_rows("%d %d %.4f %.6f %.6f %.6f", atoms),
+        ]
 
         # Maintain atomic velocities between relaxation and deposition stages
         if iteration_stage == "deposition":
-            lammps_data_object.velocities = pd.DataFrame(
-                state.velocities, index=atom_indices, columns=["vx", "vy", "vz"]
+            sections.append("\nVelocities\n\n")
+            sections.append(
+                format_rows(
+                    "%d %.8f %.8f %.8f", np.column_stack((atom_ids, state.velocities))
+                )
             )
 
-        lammps_data_object.write_file(input_data_filename)
+        with open(input_data_filename, "w") as file:
+            file.write("".join(sections))
 
     @staticmethod
     def read_outputs(filename):
@@ -149,8 +157,54 @@ class LAMMPSDriver(MolecularDynamicsDriver):
         Returns:
             state: state, elements, velocities
         """
-        data = LammpsData.from_file(f"{filename}.output_data", atom_style="charge")
-        coordinates = data.atoms[["x", "y", "z"]].to_numpy()
-        elements = data.atoms["type"].to_list()
-        velocities = data.velocities.to_numpy()
+
+        def read_section(lines, section_name, num_atoms):
+            """
+            Read the per-atom rows of a section of a LAMMPS data file.
+
+            Arguments:
+                lines (list of str): lines of the LAMMPS data file
+                section_name (str): title of the section, e.g. "Atoms"
+                num_atoms (int): the number of atoms in the simulation
+
+            Returns:
+                data (np.array): section data sorted by atom ID
+            """
+            for index, line in enumerate(lines):
+                if line.split("#", 1)[0].strip() == section_name:
+                    # the section title is followed by a blank line
+                    rows = lines[index + 2 : index + 2 + num_atoms]
+                    data = np.loadtxt(rows, ndmin=2)
+                    return data[np.argsort(data[:, 0], kind="stable")]
+            raise ValueError(f"no {section_name} section found in LAMMPS data file")
+
+        with open(f"{filename}.output_data") as file:
+            lines = file.readlines()
+
+        for line in lines:
+            if line.split()[1:] == ["atoms"]:
+                num_atoms = int(line.split()[0])
+                break
+        else:
+            raise ValueError("number of atoms not found in LAMMPS data file")
+
+        atoms = read_section(lines, "Atoms", num_atoms)
+        coordinates = atoms[:, 3:6]
+        elements = atoms[:, 1].astype(int).tolist()
+        velocities = read_section(lines, "Velocities", num_atoms)[:, 1:4]
         return State(coordinates, elements, velocities)
+
+
+def format_rows(row_format, data):
+    """
+    Format every row of a 2D array in a single string formatting operation, which
+    avoids the per-row formatting and write calls made by np.savetxt.
+
+    Arguments:
+        row_format (str): printf-style format for one row, e.g. "%d %.6f"
+        data (np.array): 2D array of values
+
+    Returns:
+        text (str): the formatted rows, each terminated by a newline
+    """
+    return (row_format + "\n") * len(data) % tuple(data.ravel())
@@ -1,8 +1,27 @@
-import os
+from string import Template
 
 from schema import And, Optional, Or, Schema, Use
 
-from deposition.input_schema import reserved_keyword, strictly_positive
+from deposition.input_schema import path_exists, reserved_keyword, strictly_positive
+
+DRIVER_REGISTRY = dict()
+"""Driver classes which can be selected in the settings, keyed on their `name` attribute."""
+
+
+def get_driver(name):
+    """
+    Returns the molecular dynamics driver class registered with the given name.
+
+    Arguments:
+        name (str): name of the driver, e.g. "LAMMPS"
+
+    Returns:
+        driver_class: subclass of MolecularDynamicsDriver
+    """
+    try:
+        return DRIVER_REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"no driver with the name '{name}' was found")
 
 
 class MolecularDynamicsDriver:
@@ -14,8 +33,8 @@ class MolecularDynamicsDriver:
 
     _schema_dict = {
         "name": str,
-        "path_to_binary": os.path.exists,
-        "path_to_input_template": os.path.exists,
+        "path_to_binary": path_exists,
+        "path_to_input_template": path_exists,
         "velocity_scaling_from_metres_per_second": And(
             Or(int, float), Use(strictly_positive)
         ),
@@ -26,6 +45,12 @@ class MolecularDynamicsDriver:
         "filename",
     ]
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # only drivers which declare a name of their own can be selected
+        if "name" in cls.__dict__:
+            DRIVER_REGISTRY[cls.name] = cls
+
     def __init__(
         self,
         driver_settings,
@@ -39,12 +64,17 @@ class MolecularDynamicsDriver:
             self.command = command
         else:
             self.command = self._command
+        self.command_template = Template(self.command)
+
+        # copy the class level defaults so that instances do not modify each other
+        self._schema_dict = dict(self._schema_dict)
+        self._reserved_keywords = list(self._reserved_keywords)
 
         if schema_dict is not None:
             self._schema_dict.update(schema_dict)
 
         if reserved_keywords is not None:
-            [self._reserved_keywords.append(kw) for kw in reserved_keywords]
+            self._reserved_keywords.extend(reserved_keywords)
 
         # add reserved keywords
         reserved_keywords_schema_dict = {
@@ -59,6 +89,10 @@ class MolecularDynamicsDriver:
         self.settings = self.schema.validate(driver_settings)
         self.simulation_cell = simulation_cell
         self.binary = self.settings["path_to_binary"]
+        self.command_substitutions = {
+            "binary": self.binary,
+            "arguments": self.settings["command_line_args"],
+        }
 
     def get_reserved_keywords(self):
         """Returns a list of global and driver specific reserved keywords"""
@@ -1,11 +1,10 @@
-import os
-
 from schema import Or
 
 from deposition import io
 from deposition.drivers.molecular_dynamics_driver import \
     MolecularDynamicsDriver
 from deposition.enums import SettingsEnum
+from deposition.input_schema import path_exists
 
 
 class TemplateDriver(MolecularDynamicsDriver):
@@ -13,7 +12,7 @@ class TemplateDriver(MolecularDynamicsDriver):
 
     schema_dict = {
         "atomic_masses": list,
-        "path_to_potential": os.path.exists,
+        "path_to_potential": path_exists,
         "thermostat_parameter": Or(float, int),
     }
 
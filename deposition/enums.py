@@ -30,6 +30,7 @@ class SettingsEnum(Enum):
     POSTPROCESSING = "postprocessing"
     RELAXATION_TIME = "relaxation_time_picoseconds"
     SIMULATION_CELL = "simulation_cell"
+    STATUS_WRITE_INTERVAL = "status_write_interval"
     STRICT_POSTPROCESSING = "strict_postprocessing"
     SUBSTRATE_XYZ_FILE = "substrate_xyz_file"
     VELOCITY_DISTRIBUTION = "velocity_distribution"
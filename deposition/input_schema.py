@@ -9,6 +9,9 @@ from deposition.distributions import (PositionDistributionEnum,
                                       VelocityDistributionEnum)
 from deposition.enums import SettingsEnum, SimulationCellEnum
 
+# matches any variable placeholder starting with the $ character, either ${with} or $without braces
+_TEMPLATE_KEY_RE = re.compile(r"\$(\{?[A-Za-z_][A-Za-z0-9_]*\}?)")
+
 
 class DepositionTypeEnum(Enum):
     """List of explicitly allowed deposition types along with conditionally required settings"""
@@ -17,34 +20,36 @@ class DepositionTypeEnum(Enum):
     molecule = ["molecule_xyz_file"]
 
 
+_DEPOSITION_TYPES = frozenset(x.name for x in DepositionTypeEnum)
+_POSITION_DISTRIBUTIONS = frozenset(x.name for x in PositionDistributionEnum)
+_VELOCITY_DISTRIBUTIONS = frozenset(x.name for x in VelocityDistributionEnum)
+
+
 def allowed_deposition_types(deposition_type):
     """Checks that the given deposition type is in the list of allowed types."""
-    try:
-        return DepositionTypeEnum[deposition_type].name
-    except KeyError:
-        raise SchemaError(
-            f"deposition type must be one of: {[x.name for x in DepositionTypeEnum]}"
-        )
+    if deposition_type in _DEPOSITION_TYPES:
+        return deposition_type
+    raise SchemaError(
+        f"deposition type must be one of: {[x.name for x in DepositionTypeEnum]}"
+    )
 
 
 def allowed_position_distributions(selected_distribution):
     """Checks that the position distribution is in the list of allowed distributions"""
-    try:
-        return PositionDistributionEnum[selected_distribution].name
-    except KeyError:
-        raise SchemaError(
-            f"position distribution must be one of: {[x.name for x in PositionDistributionEnum]}"
-        )
+    if selected_distribution in _POSITION_DISTRIBUTIONS:
+        return selected_distribution
+    raise SchemaError(
+        f"position distribution must be one of: {[x.name for x in PositionDistributionEnum]}"
+    )
 
 
 def allowed_velocity_distributions(selected_distribution):
     """Checks that the velocity distribution is in the list of allowed distributions"""
-    try:
-        return VelocityDistributionEnum[selected_distribution].name
-    except KeyError:
-        raise SchemaError(
-            f"velocity distribution must be one of: {[x.name for x in VelocityDistributionEnum]}"
-        )
+    if selected_distribution in _VELOCITY_DISTRIBUTIONS:
+        return selected_distribution
+    raise SchemaError(
+        f"velocity distribution must be one of: {[x.name for x in VelocityDistributionEnum]}"
+    )
 
 
 def strictly_positive(number):
@@ -54,6 +59,13 @@ def strictly_positive(number):
     return number
 
 
+def path_exists(path):
+    """Checks that the file or directory exists."""
+    if not os.access(path, os.F_OK):
+        raise SchemaError(f"path '{path}' does not exist")
+    return True
+
+
 def reserved_keyword(keyword):
     """Allows keywords to be reserved by molecular dynamics drivers where required."""
     raise SchemaError("this key has been reserved for internal use")
@@ -70,14 +82,11 @@ def check_input_file_syntax(driver):
     Arguments:
         driver (MolecularDynamicsDriver): driver object with a schema dictionary
     """
-    # regex matches any variable placeholder starting with the $ character, either ${with} or $without braces
-    template_key_regular_expression = (
-        r"[\$]([{]?[a-z_plane,A-Z][_,a-z_plane,A-Z,0-9]*[}]?)"
-    )
     reserved_keywords = driver.get_reserved_keywords()
+    reserved_keyword_set = frozenset(reserved_keywords)
 
     with open(driver.settings["path_to_input_template"]) as file:
-        template_matched_keys = re.findall(template_key_regular_expression, file.read())
+        template_matched_keys = _TEMPLATE_KEY_RE.findall(file.read())
 
     # check for mismatched delimiters
     template_keys = list()
@@ -86,33 +95,36 @@ def check_input_file_syntax(driver):
             raise SchemaError(f"incomplete variable specification: {key}")
         template_keys.append(key.strip("{}"))
 
+    template_key_set = set(template_keys)
+
     # check that all internal keywords are present in the template
     for key in reserved_keywords:
-        if key not in template_keys:
+        if key not in template_key_set:
             raise SchemaError(
                 f"key '{key} is used internally by {driver.name} and must be present in the template"
             )
 
     # check that the template keys are populated by the input settings
     for key in template_keys:
-        if key in driver.settings.keys():  # a value has been provided
+        if key in driver.settings:  # a value has been provided
             continue
-        elif key in reserved_keywords:  # ignore reserved keywords
+        elif key in reserved_keyword_set:  # ignore reserved keywords
             continue
-        elif key not in driver.settings.keys():  # unknown key
+        else:  # unknown key
             raise SchemaError(
                 f"unknown key '{key}' present in input template but has no set value"
             )
 
     # check for leftover keys in the input settings that are not used in the template
-    schema_keys = [k.schema if type(k) is Optional else k for k in driver.schema.schema]
+    schema_keys = {k.schema if type(k) is Optional else k for k in driver.schema.schema}
     unused_keys = list()
     for key in driver.settings:
-        if key not in template_keys and key not in schema_keys:
+        if key not in template_key_set and key not in schema_keys:
             unused_keys.append(key)
     if len(unused_keys) > 0:
         logging.warning("unused keys detected in input file:")
-        [logging.warning(f"- {key}") for key in unused_keys]
+        for key in unused_keys:
+            logging.warning("- %s", key)
 
 
 settings_schema = Schema(
@@ -137,16 +149,19 @@ settings_schema = Schema(
         SettingsEnum.RELAXATION_TIME.value: And(Or(int, float), Use(strictly_positive)),
         SettingsEnum.DRIVER_SETTINGS.value: dict,
         SettingsEnum.SIMULATION_CELL.value: dict,
-        SettingsEnum.SUBSTRATE_XYZ_FILE.value: os.path.exists,
+        SettingsEnum.SUBSTRATE_XYZ_FILE.value: path_exists,
         SettingsEnum.VELOCITY_DISTRIBUTION.value: And(
             str, Use(allowed_velocity_distributions)
         ),
         Optional(SettingsEnum.COMMAND_PREFIX.value, default=""): str,
         Optional(SettingsEnum.DEPOSITION_ELEMENT.value, default=None): str,
         Optional(SettingsEnum.LOG_FILENAME.value, default="deposition.log"): str,
-        Optional(SettingsEnum.MOLECULE_XYZ_FILE.value, default=None): os.path.exists,
+        Optional(SettingsEnum.MOLECULE_XYZ_FILE.value, default=None): path_exists,
         Optional(SettingsEnum.POSITION_DISTRIBUTION_PARAMS.value, default=[]): list,
         Optional(SettingsEnum.POSTPROCESSING.value, default=None): dict,
+        Optional(SettingsEnum.STATUS_WRITE_INTERVAL.value, default=1): And(
+            int, Use(strictly_positive)
+        ),
         Optional(SettingsEnum.STRICT_POSTPROCESSING.value, default=False): bool,
         Optional(SettingsEnum.VELOCITY_DISTRIBUTION_PARAMS.value, default=[]): list,
     }
@@ -1,58 +1,189 @@
 import collections
+import errno
 import itertools
 import logging
 import os
+import shutil
+import stat
 import sys
+import tempfile
 from string import Template
 
 import numpy as np
+import yaml
 
-from deposition.enums import DirectoriesEnum
 from deposition.state import State
 
 
+# use the libyaml bindings where available, they are several times faster
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def read_yaml(filename):
+    """
+    Reads the contents of a YAML file.
+
+    Arguments:
+        filename (path): path to the YAML file
+
+    Returns:
+        data: the parsed contents of the file
+    """
+    with open(filename) as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
+
+def write_yaml(filename, data):
+    """
+    Atomically writes data to a YAML file. The data is written to a temporary file
+    in the same directory which then replaces the target, so an interrupted write
+    cannot leave a truncated file behind.
+
+    Arguments:
+        filename (path): path to the YAML file
+        data: the data to write
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    # temporary files are private, so give the file the mode it would otherwise have
+    try:
+        mode = stat.S_IMODE(os.stat(filename).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    with tempfile.NamedTemporaryFile(
+        "w", dir=directory, prefix=f"{os.path.basename(filename)}.", delete=False
+    ) as file:
+        try:
+            os.fchmod(file.fileno(), mode)
+            yaml.dump(data, file, Dumper=_YamlDumper)
+            file.flush()
+            os.fsync(file.fileno())
+        except BaseException:
+            os.unlink(file.name)
+            raise
+    os.replace(file.name, filename)
+    fsync_directory(directory)
+
+
+def fsync_directory(directory):
+    """
+    Flushes a directory entry to disk so that renames within it are durable.
+
+    Arguments:
+        directory (path): the directory to synchronise
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # not supported on all platforms
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+_log_formatter = logging.Formatter(
+    "[%(asctime)s] %(levelname)s [%(filename)s.%(funcName)s:%(lineno)d] %(message)s",
+    datefmt="%a %d %b %Y %H:%M:%S",
+)
+
+
 def start_logging(log_filename):
     """
-    Starts logging to both stdout and given filename
+    Starts logging to both stdout and given filename. Calling this again with the
+    same filename does not add duplicate handlers.
 
     Arguments:
         log_filename (path): where to write the log file
     """
     logger = logging.getLogger("")
     logger.setLevel(logging.INFO)
-    log_to_file = logging.FileHandler(log_filename)
-    log_to_stdout = logging.StreamHandler(sys.stdout)
-    formatter = logging.Formatter(
-        "[%(asctime)s] %(levelname)s [%(filename)s.%(funcName)s:%(lineno)d] "
-        "%(message)s",
-        datefmt="%a %d %b %Y %H:%M:%S",
-    )
-    log_to_file.setFormatter(formatter)
-    log_to_stdout.setFormatter(formatter)
-    logger.addHandler(log_to_file)
-    logger.addHandler(log_to_stdout)
+    log_path = os.path.abspath(log_filename)
+    handlers = list()
+    if not any(
+        isinstance(handler, logging.FileHandler) and handler.baseFilename == log_path
+        for handler in logger.handlers
+    ):
+        handlers.append(logging.FileHandler(log_filename))
+    if not any(
+        type(handler) is logging.StreamHandler and handler.stream is sys.stdout
+        for handler in logger.handlers
+    ):
+        handlers.append(logging.StreamHandler(sys.stdout))
+    if not handlers:
+        return
+    for handler in handlers:
+        handler.setFormatter(_log_formatter)
+        logger.addHandler(handler)
     logging.info(f"logging to {log_filename} and stdout")
 
 
 def make_directories(directory_names):
     """
-    Creates directories from a list of names and logs warning instead of error when
-    directories already exist.
+    Creates directories from a list of names. No directories are created if any of
+    them already exist, to avoid mixing data from separate calculations.
 
     Arguments:
         directory_names (tuple): list of directory names to be created
     """
-    for name in directory_names:
-        try:
-            os.mkdir(name)
-            logging.info(f"created directory '{name}'")
-        except FileExistsError as error:
+    existing_directories = [name for name in directory_names if os.path.exists(name)]
+    if len(existing_directories) > 0:
+        for name in existing_directories:
             logging.warning(
                 f"directory '{name}' already exists, check for existing data"
             )
-            raise FileExistsError(
-                f"remove the following directories to proceed: {[directory.value for directory in DirectoriesEnum]}"
-            )
+        raise FileExistsError(
+            f"remove the following directories to proceed: {existing_directories}"
+        )
+
+    for name in directory_names:
+        os.makedirs(name)
+        logging.info(f"created directory '{name}'")
+
+
+def move_directory(source, destination):
+    """
+    Moves a directory, renaming it in place where possible. A copy is only made
+    when the destination is on a different filesystem.
+
+    Arguments:
+        source (path): directory to be moved
+        destination (path): new location of the directory, which must not exist
+    """
+    os.makedirs(os.path.dirname(os.path.normpath(destination)), exist_ok=True)
+    try:
+        os.rename(source, destination)
+    except OSError as error:
+        if error.errno != errno.EXDEV:
+            raise
+        shutil.move(source, destination)
+
+
+def count_lines(filename, block_size=1 << 20):
+    """
+    Counts the lines in a file by counting newline bytes in large blocks, which
+    avoids decoding the file and creating a string for every line.
+
+    Arguments:
+        filename (path): path to the file
+        block_size (int): number of bytes to read at a time
+
+    Returns:
+        num_lines (int): number of lines in the file
+    """
+    num_lines = 0
+    last_byte = b"\n"
+    with open(filename, "rb") as file:
+        for block in iter(lambda: file.read(block_size), b""):
+            num_lines += block.count(b"\n")
+            last_byte = block[-1:]
+    if last_byte != b"\n":  # final line without a trailing newline
+        num_lines += 1
+    return num_lines
 
 
 def throw_away_lines(iterator, n):
@@ -71,6 +202,30 @@ def throw_away_lines(iterator, n):
         next(itertools.islice(iterator, n, n), None)
 
 
+def read_last_lines(file, num_lines, block_size=1 << 16):
+    """
+    Reads the last lines of a file by seeking backwards from the end, so that only
+    the tail of a large file is read.
+
+    Arguments:
+        file (file object): file opened in binary mode
+        num_lines (int): number of lines to return
+        block_size (int): number of bytes to read at a time
+
+    Returns:
+        lines (list of bytes): up to `num_lines` lines from the end of the file
+    """
+    position = file.seek(0, os.SEEK_END)
+    data = b""
+    # an extra newline is needed to be sure the first line returned is complete
+    while data.count(b"\n") <= num_lines and position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        file.seek(position)
+        data = file.read(read_size) + data
+    return data.splitlines()[-num_lines:]
+
+
 def read_xyz(xyz_file, step=None):
     """
     Reads data from either the first or last step of an XYZ file.
@@ -83,33 +238,87 @@ def read_xyz(xyz_file, step=None):
     Returns:
         state: state, elements, velocities
     """
-    # Get the number of lines in the file and the number of atoms
-    num_lines = sum(1 for _ in open(xyz_file))
-    with open(xyz_file) as file:
-        num_atoms = int(file.readline())
-
     header_lines_per_step = 2
-    lines_per_step = num_atoms + header_lines_per_step
-    total_steps = int(num_lines / lines_per_step)
 
-    if step is None:
-        num_lines_to_skip = (lines_per_step * (total_steps - 1)) + header_lines_per_step
-    else:
-        num_lines_to_skip = (lines_per_step * (step - 1)) + header_lines_per_step
-
-    with open(xyz_file) as file:
-        throw_away_lines(file, num_lines_to_skip)
-        atom_data = [line.split() for ii, line in enumerate(file) if ii < num_atoms]
-        coordinates = [
-            np.array([float(atom[1]), float(atom[2]), float(atom[3])])
-            for atom in atom_data
-        ]
-        elements = [atom[0] for atom in atom_data]
-
-    if len(atom_data) != num_atoms:
+    with open(xyz_file, "rb") as file:
+        first_line = file.readline()
+        num_atoms = int(first_line)
+        lines_per_step = num_atoms + header_lines_per_step
+
+        step_lines = None
+        if step is None:
+            # the final step is normally at the end of the file, check its header
+            step_lines = read_last_lines(file, lines_per_step)
+            if step_lines[0].split() != first_line.split():
+                step_lines = None
+
+        if step_lines is None:
+            file.seek(0)
+            if step is None:
+                num_lines = count_lines(xyz_file)
+                throw_away_lines(
+                    file, lines_per_step * (num_lines // lines_per_step - 1)
+                )
+            else:
+                throw_away_lines(file, lines_per_step * (step - 1))
+            step_lines = list(itertools.islice(file, lines_per_step))
+
+    atom_lines = [line.decode() for line in step_lines[header_lines_per_step:]]
+    if len(atom_lines) != num_atoms:
         raise IOError(f"error reading step {step} of {xyz_file}")
 
-    return State(np.array(coordinates), elements, velocities=None)
+    try:
+        coordinates = np.loadtxt(atom_lines, usecols=(1, 2, 3), ndmin=2)
+    except (IndexError, ValueError) as error:
+        raise IOError(f"error reading step {step} of {xyz_file}: {error}")
+    # interning shares one string object between all atoms of the same element
+    elements = [sys.intern(line.split(maxsplit=1)[0]) for line in atom_lines]
+
+    return State(coordinates, elements, velocities=None)
+
+
+_template_cache = dict()
+
+
+def load_template(template_filename):
+    """
+    Reads a template file, reusing the previously compiled template when the file
+    has not been modified since it was last read.
+
+    Arguments:
+        template_filename (path): path to template with replaceable fields
+
+    Returns:
+        template (Template): the compiled template
+    """
+    path = os.path.abspath(template_filename)
+    file_stat = os.stat(path)
+    key = (file_stat.st_mtime_ns, file_stat.st_size)
+    try:
+        cached_key, template = _template_cache[path]
+    except KeyError:
+        cached_key, template = None, None
+    if cached_key != key:
+        with open(path) as file:
+            template = Template(file.read())
+        _template_cache[path] = (key, template)
+    return template
+
+
+def render_template(template_filename, template_values):
+    """
+    Uses the stdlib template module to perform find and replace in the provided
+    template.
+
+    Arguments:
+        template_filename (path): path to template with replaceable fields
+        template_values (dict): key/value pairs used for find and replace in the
+        template
+
+    Returns:
+        result (str): the template with all fields replaced
+    """
+    return load_template(template_filename).substitute(template_values)
 
 
 def write_file_using_template(output_filename, template_filename, template_values):
@@ -122,8 +331,6 @@ def write_file_using_template(output_filename, template_filename, template_value
         template_filename (path): path to template with replaceable fields
         template_values (dict): key/value pairs used for find and replace in the
     """
-    with open(template_filename) as file:
-        template = Template(file.read())
-        result = template.substitute(template_values)
+    result = render_template(template_filename, template_values)
     with open(output_filename, "w") as file:
         file.write(result)
@@ -1,10 +1,12 @@
+import contextlib
 import logging
 import os
+import re
+import shlex
 import shutil
 import subprocess
-from string import Template
 
-from deposition import postprocessing, randomisation
+from deposition import io, postprocessing, randomisation
 from deposition.enums import DirectoriesEnum
 from deposition.state import State
 
@@ -25,7 +27,15 @@ class Iteration:
     molecular dynamics software.
     """
 
-    def __init__(self, driver, settings, status):
+    def __init__(self, driver, settings, status, state=None):
+        """
+        Arguments:
+            driver: molecular dynamics driver
+            settings: settings of the deposition calculation
+            status: status of the deposition calculation
+            state (State, optional): the state stored at `status.pickle_location`, read
+            from disk when not given
+        """
         self.driver = driver
         self.settings = settings
         self.iteration_number = status.iteration_number
@@ -39,7 +49,9 @@ class Iteration:
             f"relaxation{self.iteration_number:04d}",
         )
         self.success = False
-        self.state = State.read_state(self.pickle_location)
+        if state is None:
+            state = State.read_state(self.pickle_location)
+        self.state = state
 
     def run(self):
         """
@@ -81,23 +93,36 @@ class Iteration:
 
     def finalisation(self):
         """Finalises the iteration by moving the data to the appropriate directory"""
-        self.state.write(f"{self.deposition_filename}.pickle", include_velocities=False)
+        pickle_filename = f"{self.deposition_filename}.pickle"
+        # data from failed iterations is only kept for diagnostics so it is not synced
+        self.state.write(
+            pickle_filename, include_velocities=False, durable=self.success
+        )
         if self.success:
             destination_directory = os.path.join(
-                DirectoriesEnum.SUCCESS.value, f"{self.iteration_number:03d}/"
+                DirectoriesEnum.SUCCESS.value, f"{self.iteration_number:03d}"
             )
             self.pickle_location = os.path.join(
-                destination_directory, f"deposition{self.iteration_number:03d}.pickle"
+                destination_directory, os.path.basename(pickle_filename)
             )
         else:
             destination_directory = os.path.join(
-                DirectoriesEnum.FAILED.value, f"{self.iteration_number:03d}/"
+                DirectoriesEnum.FAILED.value, f"{self.iteration_number:03d}"
             )
+        # a restart repeats any iterations completed since the status file was written
+        for directory in (DirectoriesEnum.SUCCESS.value, DirectoriesEnum.FAILED.value):
+            previous_directory = os.path.join(directory, f"{self.iteration_number:03d}")
+            if os.path.exists(previous_directory):
+                logging.warning(
+                    f"replacing data from a previous run in {previous_directory}"
+                )
+                shutil.rmtree(previous_directory)
         logging.info(
             f"moving data for iteration {self.iteration_number} to {destination_directory}"
         )
-        shutil.copytree(DirectoriesEnum.WORKING.value, destination_directory)
-        shutil.rmtree(DirectoriesEnum.WORKING.value)
+        io.move_directory(DirectoriesEnum.WORKING.value, destination_directory)
+        if self.success:
+            io.fsync_directory(DirectoriesEnum.SUCCESS.value)
         os.mkdir(DirectoriesEnum.WORKING.value)
 
     def run_postprocessing(self):
@@ -125,13 +150,67 @@ class Iteration:
 
     def call_process(self, filename):
         """Run the molecular dynamics software for this phase of the iteration."""
-        command_template = Template(self.driver.command)
-        command_template_values = dict()
+        command_template_values = self.driver.command_substitutions.copy()
         command_template_values["prefix"] = self.settings.command_prefix
-        command_template_values["binary"] = self.driver.binary
-        command_template_values["arguments"] = self.driver.settings["command_line_args"]
         command_template_values["input_file"] = f"{filename}.input"
         command_template_values["output_file"] = f"{filename}.output"
-        command = command_template.substitute(command_template_values)
+        command = self.driver.command_template.substitute(command_template_values)
         logging.info(f"running: {command}")
+        run_command(command)
+
+
+_ASSIGNMENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*=")
+_EXPANSION_RE = re.compile(r"[$~*?\[`]")
+_QUOTING_RE = re.compile(r"[\"'\\]")
+
+
+def run_command(command):
+    """
+    Runs a command, redirecting input and output without starting a shell where
+    possible. Commands using shell syntax other than simple `<` and `>` redirection,
+    such as quoting, variable assignments, expansions, or pipes, are passed to the
+    shell unchanged.
+
+    Arguments:
+        command (str): the command to run
+    """
+    lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+    lexer.whitespace_split = True
+
+    arguments = list()
+    redirections = dict()
+    shell_required = False
+    for token in lexer:
+        if token in ("<", ">") and token not in redirections:
+            # a preceding number may be a file descriptor, e.g. 2>
+            if arguments and arguments[-1].isdigit():
+                shell_required = True
+            redirections[token] = next(lexer, None)
+            if redirections[token] is None:
+                shell_required = True
+        elif all(character in lexer.punctuation_chars for character in token):
+            shell_required = True
+        else:
+            arguments.append(token)
+
+    # the lexer removes quoting, so a quoted < or > cannot be told from a redirection
+    if _QUOTING_RE.search(command):
+        shell_required = True
+    # variable assignments and expansions are left to the shell
+    words = arguments + [path for path in redirections.values() if path is not None]
+    if arguments and _ASSIGNMENT_RE.match(arguments[0]):
+        shell_required = True
+    if any(_EXPANSION_RE.search(word) for word in words):
+        shell_required = True
+
+    if shell_required:
         subprocess.run(command, shell=True, check=True)
+        return
+
+    with contextlib.ExitStack() as stack:
+        stdin, stdout = None, None
+        if "<" in redirections:
+            stdin = stack.enter_context(open(redirections["<"], "rb"))
+        if ">" in redirections:
+            stdout = stack.enter_context(open(redirections[">"], "wb"))
+        subprocess.run(arguments, stdin=stdin, stdout=stdout, check=True)
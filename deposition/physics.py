@@ -1,5 +1,4 @@
 import logging
-import math
 
 import numpy as np
 from pymatgen.core import Element
@@ -12,6 +11,26 @@ CONSTANTS = {
 Define physical constants of the universe used by other functions.
 """
 
+# PCG64 generator, which samples normals with the ziggurat method
+rng = np.random.default_rng()
+"""
+Random number generator shared by all sampling in the package.
+"""
+
+
+def seed_rng(seed=None):
+    """
+    Reseeds the shared random number generator in place, so that every module
+    drawing from it sees the new stream.
+
+    Arguments:
+        seed (int): seed for reproducible sampling, fresh entropy is used if None
+    """
+    rng.bit_generator.state = np.random.PCG64(seed).state
+
+
+_MASS_CACHE = dict()
+
 
 def get_canonical_variance(num_atoms, temperature=300.0):
     """
@@ -39,43 +58,80 @@ def get_canonical_variance(num_atoms, temperature=300.0):
     return canonical_variance
 
 
-def normal_distribution(mean, sigma):
+def normal_distribution(mean, sigma, size=None):
     """
-    Uses the `numpy.random.normal` function to generate random values from a normal distribution.
+    Uses the shared generator to generate random values from a normal distribution.
 
     Arguments:
-        mean (float): the centre of the normal distribution
-        sigma (float): the standard deviation of the normal distribution
+        mean (float or np.array): the centre of the normal distribution
+        sigma (float or np.array): the standard deviation of the normal distribution
+        size (int or tuple, default=None): output shape, a single value is drawn when None
 
     Returns:
-        randomly distributed value (float)
+        randomly distributed value(s) (float or np.array)
     """
-    return np.random.normal(loc=mean, scale=sigma)
+    return rng.normal(loc=mean, scale=sigma, size=size)
 
 
 def velocity_from_normal_distribution(gas_temperature, particle_mass, mean=0.0):
     """
     Return a velocity in metres per second randomly selected from a normal distribution.
+    An array of masses gives an array of velocities drawn in a single call.
 
     Arguments:
         gas_temperature (float): temperature of the ideal gas in Kelvin
-        particle_mass (float): mass of the particle in kg
+        particle_mass (float or np.array): mass of the particle(s) in kg
         mean (float): centre of the distribution in metres per second
 
     Returns:
-        random velocity in metres per second (float)
+        random velocity in metres per second (float or np.array)
     """
-    if particle_mass > 0:
-        sigma = math.sqrt(
-            (CONSTANTS["BoltzmannConstant"] * gas_temperature) / particle_mass
-        )
-        return normal_distribution(mean, sigma)
-    else:
+    masses = np.asarray(particle_mass, dtype=float)
+    positive = masses > 0
+    if not np.all(positive):
         logging.warning(
             "Particle mass in velocity calculation is zero, returning zero velocity. Note: this could be "
             "due to a calculated zero for moment of inertia if you are depositing an on-axis molecule"
         )
-        return 0
+    sigma = np.sqrt(
+        (CONSTANTS["BoltzmannConstant"] * gas_temperature)
+        / np.where(positive, masses, 1.0)
+    )
+    velocities = np.where(positive, normal_distribution(mean, sigma), 0.0)
+    if velocities.ndim == 0:
+        return float(velocities)
+    return velocities
+
+
+def _atomic_mass(element):
+    """
+    Look up the atomic mass of an element in atomic mass units, querying pymatgen only the first time it is seen
+
+    Arguments:
+        element (str): element name
+
+    Returns:
+        atomic_mass (float): atomic mass in atomic mass units
+    """
+    if element not in _MASS_CACHE:
+        _MASS_CACHE[element] = float(Element(element).atomic_mass)
+    return _MASS_CACHE[element]
+
+
+def _masses_for(elements):
+    """
+    Arguments:
+        elements (list): list of str with element names
+
+    Returns:
+        masses (np.array): atomic masses in kg
+    """
+    masses = np.fromiter(
+        (_atomic_mass(element) for element in elements),
+        dtype=np.float64,
+        count=len(elements),
+    )
+    return masses * CONSTANTS["AtomicMassUnit_kg"]
 
 
 def get_centre_of_mass(coordinates, elements):
@@ -89,16 +145,11 @@ def get_centre_of_mass(coordinates, elements):
     Returns:
         centre_of_mass, masses (tuple)
             - centre_of_mass (array): xyz coordinate of the centre of mass
-            - masses (list): list of the atomic masses in kg
-    """
-    atoms = [Element(e) for e in elements]
-    masses = [
-        CONSTANTS["AtomicMassUnit_kg"] * float(atom.atomic_mass) for atom in atoms
-    ]
-    centre_of_mass_list = [
-        mass * coordinate for mass, coordinate in zip(masses, coordinates)
-    ]
-    centre_of_mass = np.sum(centre_of_mass_list, axis=0) / np.sum(masses)
+            - masses (array): the atomic masses in kg
+    """
+    coordinates = np.asarray(coordinates, dtype=float)
+    masses = _masses_for(elements)
+    centre_of_mass = (masses[:, None] * coordinates).sum(axis=0) / masses.sum()
     return centre_of_mass, masses
 
 
@@ -114,10 +165,8 @@ def get_moment_of_inertia(coordinates, elements):
         moment_of_inertia (array): moment of inertia around the x, y, and z_plane axes
 
     """
+    coordinates = np.asarray(coordinates, dtype=float)
     centre_of_mass, masses = get_centre_of_mass(coordinates, elements)
-    distances = [np.subtract(coordinate, centre_of_mass) for coordinate in coordinates]
-    mass_distance_product = np.atleast_2d(
-        [mass * np.abs(distance) for mass, distance in zip(masses, distances)]
-    )
-    moment_of_inertia = np.sum(mass_distance_product, axis=0)
+    distances = coordinates - centre_of_mass
+    moment_of_inertia = (masses[:, None] * np.abs(distances)).sum(axis=0)
     return moment_of_inertia
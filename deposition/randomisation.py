@@ -46,20 +46,19 @@ def new_coordinates_and_velocities(settings, state, simulation_cell, velocity_sc
     )
 
     logging.info(f"generating coordinates and velocities for deposited atom(s)")
-    for ii in range(settings.num_deposited_per_iteration):
-        if settings.deposition_type == DepositionTypeEnum.MONATOMIC.name:
-            deposition_coordinates = [0, 0, 0]
-            deposition_elements = [settings.deposition_element]
-        elif settings.deposition_type == DepositionTypeEnum.MOLECULE.name:
-            molecule = io.read_xyz(settings.molecule_xyz_file)
-            deposition_coordinates = molecule.coordinates
-            deposition_elements = molecule.elements
-        else:
-            raise ValueError(f"unknown deposition type: {settings.deposition_type}")
-
-        new_coordinates = get_new_positions(
-            position_distribution, deposition_coordinates
-        )
+    if settings.deposition_type == DepositionTypeEnum.MONATOMIC.name:
+        deposition_coordinates = [0, 0, 0]
+        deposition_elements = [settings.deposition_element]
+    elif settings.deposition_type == DepositionTypeEnum.MOLECULE.name:
+        molecule = io.read_xyz(settings.molecule_xyz_file)
+        deposition_coordinates = molecule.coordinates
+        deposition_elements = molecule.elements
+    else:
+        raise ValueError(f"unknown deposition type: {settings.deposition_type}")
+
+    positions = position_distribution.prefill(settings.num_deposited_per_iteration)
+    for position in positions:
+        new_coordinates = get_new_positions(position, deposition_coordinates)
         new_elements = deposition_elements
         new_velocities = get_new_velocities(
             velocity_distribution,
@@ -110,7 +109,9 @@ def get_polygon_on_plane(simulation_cell, z_plane):
     return polygon_coordinates
 
 
-def random_velocity(velocity_distribution, minimum_velocity, max_iterations=10000):
+def random_velocity(
+    velocity_distribution, minimum_velocity, max_iterations=10000, batch_size=256
+):
     """
     Randomly generate the velocity of the newly added particles(s) based on the
     kinetic temperature and mass.
@@ -120,29 +121,30 @@ def random_velocity(velocity_distribution, minimum_velocity, max_iterations=1000
         minimum_velocity (float): minimum bound on the generated velocity (m/s)
         max_iterations (int): upper bound when trying to get a velocity under
         `min_velocity`
+        batch_size (int): number of candidate velocities drawn at once
 
     Returns:
         new_velocity (np.array): velocity of the newly added particle(s)
     """
-    for ii in range(max_iterations):
-        vx, vy, vz = velocity_distribution.get_velocity()
-        vz = np.abs(vz)
-        if vz > minimum_velocity:
-            return np.array((vx, vy, -vz))
+    for ii in range(0, max_iterations, batch_size):
+        candidates = velocity_distribution.prefill(batch_size)
+        valid = np.abs(candidates[:, 2]) > minimum_velocity
+        if valid.any():
+            vx, vy, vz = candidates[np.argmax(valid)]
+            return np.array((vx, vy, -np.abs(vz)))
     raise ValueError(
         f"failed to generate a velocity greater than the specified minimum of "
         f"{minimum_velocity} m/s after {max_iterations} iterations"
     )
 
 
-def get_new_positions(position_distribution, molecule_coordinates):
+def get_new_positions(position, molecule_coordinates):
     """
-    Randomly generates a position within the simulation cell on a plane at the
-    specified z_plane-coordinate and centres the
-    atom/molecule at this point.
+    Centres the atom/molecule at a position generated within the simulation cell on
+    a plane at the specified z_plane-coordinate.
 
     Arguments:
-        position_distribution: functional form for obtaining the new position
+        position (np.array): xyz-coordinates drawn from the position distribution
         molecule_coordinates (np.array): state of the atoms in the molecule to
         be added
 
@@ -151,7 +153,7 @@ def get_new_positions(position_distribution, molecule_coordinates):
         generated position in the cell
     """
     centre = molecule_coordinates - np.mean(molecule_coordinates, axis=0)
-    new_coordinates = position_distribution.get_position() + centre
+    new_coordinates = position + centre
     return new_coordinates
 
 
@@ -182,18 +184,12 @@ def get_new_velocities(
     # add rotational velocities to molecules
     centre_of_mass, masses = physics.get_centre_of_mass(coordinates, elements)
     moment_of_inertia_xyz = physics.get_moment_of_inertia(coordinates, elements)
-    distances = [np.subtract(coordinate, centre_of_mass) for coordinate in coordinates]
-    rotational_velocities = [
-        physics.velocity_from_normal_distribution(temperature, moment_of_inertia)
-        if moment_of_inertia > 0
-        else 0
-        for moment_of_inertia in moment_of_inertia_xyz
-    ]
-    tangential_velocities = [rotational_velocities * distance for distance in distances]
-    velocities = [
-        translational + tangential
-        for translational, tangential in zip(
-            translational_velocities, tangential_velocities
-        )
-    ]
+    distances = np.asarray(coordinates) - centre_of_mass
+    rotational_velocities = np.zeros(3)
+    rotating = moment_of_inertia_xyz > 0
+    rotational_velocities[rotating] = physics.velocity_from_normal_distribution(
+        temperature, moment_of_inertia_xyz[rotating]
+    )
+    tangential_velocities = rotational_velocities * distances
+    velocities = translational_velocities + tangential_velocities
     return velocities
@@ -1,12 +1,36 @@
-import yaml
-
-from deposition import distributions, input_schema, postprocessing
+from deposition import distributions, input_schema, io, postprocessing
 from deposition.enums import SettingsEnum
 
 
 class Settings:
     """Class to hold all settings for the deposition calculation"""
 
+    __slots__ = (
+        "command_prefix",
+        "deposition_element",
+        "deposition_height",
+        "deposition_temperature",
+        "deposition_time",
+        "deposition_type",
+        "driver_settings",
+        "log_filename",
+        "max_sequential_failures",
+        "max_total_iterations",
+        "min_velocity",
+        "molecule_xyz_file",
+        "num_deposited_per_iteration",
+        "position_distribution",
+        "position_distribution_parameters",
+        "postprocessing",
+        "relaxation_time",
+        "simulation_cell",
+        "status_write_interval",
+        "strict_postprocessing",
+        "substrate_xyz_file",
+        "velocity_distribution",
+        "velocity_distribution_parameters",
+    )
+
     def __init__(self, settings):
         self.command_prefix = settings[SettingsEnum.COMMAND_PREFIX.value]
         self.deposition_element = settings[SettingsEnum.DEPOSITION_ELEMENT.value]
@@ -34,6 +58,7 @@ class Settings:
         self.postprocessing = settings[SettingsEnum.POSTPROCESSING.value]
         self.relaxation_time = settings[SettingsEnum.RELAXATION_TIME.value]
         self.simulation_cell = settings[SettingsEnum.SIMULATION_CELL.value]
+        self.status_write_interval = settings[SettingsEnum.STATUS_WRITE_INTERVAL.value]
         self.strict_postprocessing = settings[SettingsEnum.STRICT_POSTPROCESSING.value]
         self.substrate_xyz_file = settings[SettingsEnum.SUBSTRATE_XYZ_FILE.value]
         self.velocity_distribution = settings[SettingsEnum.VELOCITY_DISTRIBUTION.value]
@@ -78,8 +103,7 @@ class Settings:
         Returns:
             settings (dict): validated settings for the deposition simulation
         """
-        with open(filename) as file:
-            settings_dict = yaml.safe_load(file)
+        settings_dict = io.read_yaml(filename)
         settings_dict = input_schema.get_settings_schema().validate(settings_dict)
         settings = Settings(settings_dict)
         settings.validate(settings_dict)
@@ -87,8 +111,4 @@ class Settings:
 
     def as_dict(self):
         """Returns the settings as a dictionary"""
-        return {
-            key: value
-            for key, value in self.__dict__.items()
-            if not key.startswith("__") and not callable(key)
-        }
+        return {key: getattr(self, key) for key in self.__slots__}
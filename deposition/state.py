@@ -1,5 +1,9 @@
 import logging
+import os
 import pickle
+import zipfile
+
+import numpy as np
 
 from deposition.enums import StateEnum
 
@@ -12,41 +16,56 @@ class State:
         self.elements = elements
         self.velocities = velocities
 
-    def write(self, pickle_location, include_velocities=True):
+    def write(self, pickle_location, include_velocities=True, durable=True):
         """
-        Write current state to a pickle file.
+        Write current state to disk as a set of numpy arrays (`.npz` format).
 
         Arguments:
-            pickle_location (path): path to save the pickled data to
+            pickle_location (path): path to save the data to
             include_velocities (bool): whether to save velocities or not
+            durable (bool): whether to wait for the data to reach the disk
         """
         data = {
-            StateEnum.COORDINATES.value: self.coordinates,
-            StateEnum.ELEMENTS.value: self.elements,
-            StateEnum.VELOCITIES.value: self.velocities if include_velocities else None,
+            StateEnum.COORDINATES.value: np.asarray(self.coordinates),
+            StateEnum.ELEMENTS.value: np.asarray(self.elements),
         }
+        if include_velocities and self.velocities is not None:
+            data[StateEnum.VELOCITIES.value] = np.asarray(self.velocities)
         logging.info(f"writing state to {pickle_location}")
         with open(pickle_location, "wb") as file:
-            pickle.dump(data, file)
+            np.savez(file, **data)
+            if durable:
+                file.flush()
+                os.fsync(file.fileno())
 
     @staticmethod
     def read_state(pickle_location):
         """
-        Reads current state of calculation from pickle file. The pickle file stores the
-        state, species (elements),
-        and velocities of all simulated atoms.
+        Reads current state of calculation from disk. The file stores the coordinates,
+        species (elements), and velocities of all simulated atoms. Files written by
+        older versions using pickle are also supported.
 
         Arguments:
-            pickle_location (path): path read the pickled data from
+            pickle_location (path): path read the data from
 
         Returns:
             state: state, elements, velocities
         """
         logging.info(f"reading state from {pickle_location}")
-        with open(pickle_location, "rb") as file:
-            data = pickle.load(file)
-        return State(
-            data[StateEnum.COORDINATES.value],
-            data[StateEnum.ELEMENTS.value],
-            data[StateEnum.VELOCITIES.value],
-        )
+        if not zipfile.is_zipfile(pickle_location):
+            with open(pickle_location, "rb") as file:
+                data = pickle.load(file)
+            return State(
+                data[StateEnum.COORDINATES.value],
+                data[StateEnum.ELEMENTS.value],
+                data[StateEnum.VELOCITIES.value],
+            )
+
+        with np.load(pickle_location, allow_pickle=False) as data:
+            coordinates = data[StateEnum.COORDINATES.value]
+            elements = data[StateEnum.ELEMENTS.value].tolist()
+            if StateEnum.VELOCITIES.value in data.files:
+                velocities = data[StateEnum.VELOCITIES.value]
+            else:
+                velocities = None
+        return State(coordinates, elements, velocities)
@@ -1,7 +1,6 @@
 from datetime import datetime as dt
 
-import yaml
-
+from deposition import io
 from deposition.enums import StatusEnum
 
 
@@ -14,13 +13,15 @@ class Status:
         sequential_failures,
         total_failures,
         pickle_location,
-        last_updated=dt.now(),
+        last_updated=None,
     ):
         self.iteration_number = iteration_number
         self.sequential_failures = sequential_failures
         self.total_failures = total_failures
         self.pickle_location = pickle_location
-        self.last_updated = last_updated
+        if last_updated is None:
+            last_updated = self.timestamp()
+        self.last_updated = str(last_updated)
 
     def write(self, filename):
         """
@@ -28,16 +29,19 @@ class Status:
         failures, and the most recent saved state of the deposition simulation to
         `status.yaml`.
         """
-        self.last_updated = dt.now()
-        with open(filename, "w") as file:
-            yaml.dump(self.as_dict(), file)
+        self.last_updated = self.timestamp()
+        io.write_yaml(filename, self.as_dict())
+
+    @staticmethod
+    def timestamp():
+        """Returns the current time as an ISO 8601 string"""
+        return dt.now().isoformat(sep=" ", timespec="seconds")
 
     @staticmethod
     def from_file(filename):
         """Reads the status from the given file"""
         try:
-            with open(filename) as file:
-                status = yaml.safe_load(file)
+            status = io.read_yaml(filename)
             return Status(
                 int(status[StatusEnum.ITERATION_NUMBER.value]),
                 int(status[StatusEnum.SEQUENTIAL_FAILURES.value]),
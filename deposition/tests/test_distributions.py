@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
+from matplotlib import path as mplpath
 
-from deposition import distributions
+from deposition import distributions, physics
 
 POLYGON_COORDINATES = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]
 Z_PLANE = 5.0
@@ -28,3 +30,73 @@ def test_velocity_distributions(distribution):
     assert len(velocity) == 3, error_text
     for value in velocity:
         assert type(value) is float, error_text
+
+
+@pytest.mark.parametrize(
+    "distribution",
+    [
+        distributions.get_position_distribution(
+            distribution.name, POLYGON_COORDINATES, Z_PLANE
+        )
+        for distribution in distributions.PositionDistributionEnum
+    ]
+    + [
+        distributions.get_velocity_distribution(distribution.name)
+        for distribution in distributions.VelocityDistributionEnum
+    ],
+)
+def test_prefill(distribution):
+    values = distribution.prefill(10)
+    assert isinstance(values, np.ndarray)
+    assert values.shape == (10, 3)
+
+
+def test_uniform_position_inside_polygon():
+    triangle = [(0.0, 0.0), (10.0, 0.0), (0.0, 10.0)]
+    distribution = distributions.get_position_distribution("uniform", triangle, Z_PLANE)
+    for _ in range(100):
+        x, y, z = distribution.get_position()
+        assert x >= 0.0 and y >= 0.0 and x + y <= 10.0
+        assert z == Z_PLANE
+    positions = distribution.prefill(100)
+    assert np.all(positions[:, :2] >= 0.0)
+    assert np.all(positions[:, 0] + positions[:, 1] <= 10.0)
+    assert np.all(positions[:, 2] == Z_PLANE)
+
+
+def test_seed_rng():
+    position_distribution = distributions.get_position_distribution(
+        "uniform", POLYGON_COORDINATES, Z_PLANE
+    )
+    velocity_distribution = distributions.get_velocity_distribution("gaussian")
+    physics.seed_rng(42)
+    positions = position_distribution.prefill(5)
+    velocities = velocity_distribution.prefill(5)
+    physics.seed_rng(42)
+    assert np.array_equal(positions, position_distribution.prefill(5))
+    assert np.array_equal(velocities, velocity_distribution.prefill(5))
+
+
+@pytest.mark.parametrize(
+    "polygon",
+    [
+        [(0.0, 0.0), (10.0, 0.0), (15.0, 10.0), (5.0, 10.0)],  # parallelogram
+        [(0.0, 0.0), (10.0, 0.0), (10.0, 2.0), (2.0, 2.0), (2.0, 10.0), (0.0, 10.0)],
+        [  # five-point star, which turns the same way at every vertex
+            (5.0 + 5.0 * np.cos(angle), 5.0 + 5.0 * np.sin(angle))
+            for angle in np.radians(90.0 + 144.0 * np.arange(5))
+        ],
+    ],
+)
+def test_uniform_position_is_uniform(polygon):
+    physics.seed_rng(0)
+    distribution = distributions.get_position_distribution("uniform", polygon, Z_PLANE)
+    positions = distribution.prefill(20000)
+    path = mplpath.Path(polygon)
+    assert np.all(path.contains_points(positions[:, :2], radius=1e-9))
+    # the mean of uniformly distributed points is the centroid of the polygon
+    vertices = np.array(polygon)
+    following = np.roll(vertices, -1, axis=0)
+    cross = vertices[:, 0] * following[:, 1] - following[:, 0] * vertices[:, 1]
+    centroid = ((vertices + following) * cross[:, None]).sum(axis=0) / (3 * cross.sum())
+    np.testing.assert_allclose(positions[:, :2].mean(axis=0), centroid, atol=0.1)
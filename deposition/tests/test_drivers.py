@@ -2,6 +2,7 @@ import inspect
 
 import pytest
 
+from deposition import drivers
 from deposition.drivers import driver_enums
 
 
@@ -20,3 +21,13 @@ def test_method_signatures(driver, method, expected):
     assert (
         len(inspect.signature(method_to_run).parameters) == expected
     ), f"{method_to_run} does not have correct number of arguments"
+
+
+@pytest.mark.parametrize("driver", driver_enums.DriverEnum)
+def test_get_driver(driver):
+    assert drivers.get_driver(driver.name) is driver.value
+
+
+def test_get_unknown_driver():
+    with pytest.raises(ValueError):
+        drivers.get_driver("unknown")
@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+
+from deposition import utils
+from deposition.drivers.gulp_driver import GULPDriver
+from deposition.state import State
+
+NUM_ATOMS = 2
+NUM_STEPS = 3
+
+SIMULATION_CELL = {"a": 10, "b": 10, "c": 50, "alpha": 90, "beta": 90, "gamma": 90}
+
+TEMPLATE = """conv md
+cell
+${x_size} ${y_size} ${z_size} ${alpha} ${beta} ${gamma}
+production ${production_time_picoseconds} ps
+output trajectory ascii ${filename}
+ensemble nvt ${thermostat_damping}
+"""
+
+
+def write_trajectory(filename):
+    with open(filename, "w") as file:
+        file.write("#  Version   1.0\n")
+        file.write(f"  {NUM_ATOMS}  3\n")
+        for step in range(1, NUM_STEPS + 1):
+            file.write("#  Time/KE/E/T\n")
+            file.write(f"  {step * 0.1} 1.0 -10.0 300.0\n")
+            for data_type in ["Coordinates", "Velocities", "Derivatives"]:
+                file.write(f"#  {data_type}\n")
+                for atom in range(NUM_ATOMS):
+                    file.write(f"  {step}.0 {atom}.0 {len(data_type)}.0\n")
+
+
+def write_xyz(filename):
+    with open(filename, "w") as file:
+        file.write(f"{NUM_ATOMS}\nfinal step\n")
+        for atom in range(NUM_ATOMS):
+            file.write(f"Al {atom}.0 0.0 1.0\n")
+
+
+def test_read_outputs_last_step(tmp_path):
+    filename = os.path.join(tmp_path, "deposition0001")
+    write_trajectory(f"{filename}.trg")
+    write_xyz(f"{filename}.xyz")
+    state = GULPDriver.read_outputs(filename)
+    assert state.elements == ["Al", "Al"]
+    np.testing.assert_array_equal(state.coordinates[:, 0], [0.0, 1.0])
+    np.testing.assert_array_equal(
+        state.velocities, [[NUM_STEPS, 0.0, 10.0], [NUM_STEPS, 1.0, 10.0]]
+    )
+
+
+def test_write_inputs(tmp_path):
+    template_filename = os.path.join(tmp_path, "template.txt")
+    with open(template_filename, "w") as file:
+        file.write(TEMPLATE)
+    driver_settings = {
+        "name": "GULP",
+        "path_to_binary": template_filename,
+        "path_to_input_template": template_filename,
+        "velocity_scaling_from_metres_per_second": 0.01,
+        "GULP_LIB": str(tmp_path),
+        "temperature_of_system": 300,
+        "relaxation_time_picoseconds": 1.0,
+        "deposition_time_picoseconds": 2.0,
+    }
+    driver = GULPDriver(driver_settings, utils.get_simulation_cell(SIMULATION_CELL))
+    state = State(
+        coordinates=np.array([[0.0, 0.0, 1.0], [1.0, 1.0, 2.0]]),
+        elements=["Al", "O"],
+        velocities=np.array([[0.0, 0.0, -1.0], [0.0, 0.0, 0.0]]),
+    )
+    filename = os.path.join(tmp_path, "deposition0001")
+    driver.write_inputs(filename, state, "deposition")
+    assert "filename" not in driver.settings
+    with open(f"{filename}.input") as file:
+        lines = file.read().splitlines()
+    assert lines[3] == "production 2.0 ps"
+    assert lines[6:9] == ["cartesian", "Al 0.0 0.0, 1.0", "O 1.0 1.0, 2.0"]
+    assert lines[9:] == ["velocities", "0 0.0 0.0 -1.0", "1 0.0 0.0 0.0"]
@@ -0,0 +1,117 @@
+import logging
+import os
+
+import numpy as np
+import pytest
+
+from deposition import io
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), "test_data")
+
+
+def test_move_directory(tmp_path):
+    source = os.path.join(tmp_path, "current")
+    destination = os.path.join(tmp_path, "iterations", "001")
+    os.mkdir(source)
+    with open(os.path.join(source, "data.txt"), "w") as file:
+        file.write("data")
+    io.move_directory(source, destination)
+    assert not os.path.exists(source)
+    assert os.listdir(destination) == ["data.txt"]
+
+
+def test_write_yaml_file_mode(tmp_path):
+    filename = os.path.join(tmp_path, "status.yaml")
+    umask = os.umask(0o022)
+    try:
+        io.write_yaml(filename, {"value": 1})
+    finally:
+        os.umask(umask)
+    assert os.stat(filename).st_mode & 0o777 == 0o644
+    os.chmod(filename, 0o640)
+    io.write_yaml(filename, {"value": 2})
+    assert os.stat(filename).st_mode & 0o777 == 0o640
+    assert io.read_yaml(filename) == {"value": 2}
+
+
+def test_load_template_detects_changes(tmp_path):
+    filename = os.path.join(tmp_path, "template.txt")
+    with open(filename, "w") as file:
+        file.write("run ${num_steps}")
+    assert io.load_template(filename) is io.load_template(filename)
+    assert io.render_template(filename, {"num_steps": 10}) == "run 10"
+    with open(filename, "w") as file:
+        file.write("run ${num_steps} steps")
+    assert io.render_template(filename, {"num_steps": 10}) == "run 10 steps"
+
+
+def test_read_xyz():
+    state = io.read_xyz(os.path.join(TEST_DATA, "valid_xyz.xyz"))
+    assert state.coordinates.shape == (96, 3)
+    assert len(state.elements) == 96
+    assert state.elements[0] == "1"
+    np.testing.assert_allclose(
+        state.coordinates[0], [5.933052360, 1.969879892, 0.008131208]
+    )
+
+
+def write_trajectory(filename, num_steps, partial_step=False):
+    with open(filename, "w") as file:
+        for step in range(1, num_steps + 1):
+            file.write(f"2\nstep {step}\n")
+            file.write(f"Al {step}.0 0.0 0.0\nO {step}.5 0.0 0.0\n")
+        if partial_step:
+            file.write("2\nstep\nAl 0.0 0.0 0.0\n")
+
+
+@pytest.mark.parametrize("partial_step", [False, True])
+@pytest.mark.parametrize("step, expected", [(None, 3.0), (1, 1.0), (2, 2.0)])
+def test_read_xyz_step(tmp_path, partial_step, step, expected):
+    filename = os.path.join(tmp_path, "trajectory.xyz")
+    write_trajectory(filename, 3, partial_step)
+    state = io.read_xyz(filename, step)
+    assert state.elements == ["Al", "O"]
+    np.testing.assert_array_equal(state.coordinates[:, 0], [expected, expected + 0.5])
+
+
+def test_read_invalid_xyz():
+    with pytest.raises(IOError):
+        io.read_xyz(os.path.join(TEST_DATA, "invalid_xyz.xyz"))
+
+
+def test_make_directories_refuses_existing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("existing")
+    with pytest.raises(FileExistsError):
+        io.make_directories(("new", "existing"))
+    assert not os.path.exists("new")
+    io.make_directories(("new", "other"))
+    assert os.path.isdir("new") and os.path.isdir("other")
+
+
+@pytest.mark.parametrize(
+    ["contents", "expected"], [["", 0], ["a\nb\n", 2], ["a\nb", 2], ["\n\n\n", 3]]
+)
+def test_count_lines(tmp_path, contents, expected):
+    filename = os.path.join(tmp_path, "lines.txt")
+    with open(filename, "w") as file:
+        file.write(contents)
+    assert io.count_lines(filename, block_size=2) == expected
+    with open(filename) as file:
+        assert sum(1 for _ in file) == expected
+
+
+def test_start_logging_does_not_duplicate_handlers(tmp_path):
+    logger = logging.getLogger("")
+    existing_handlers = list(logger.handlers)
+    log_filename = os.path.join(tmp_path, "deposition.log")
+    try:
+        io.start_logging(log_filename)
+        handlers = list(logger.handlers)
+        io.start_logging(log_filename)
+        assert logger.handlers == handlers
+    finally:
+        for handler in list(logger.handlers):
+            if handler not in existing_handlers:
+                logger.removeHandler(handler)
+                handler.close()
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from deposition.iteration import Iteration, run_command
+from deposition.state import State
+from deposition.status import Status
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "cat < input.txt > output.txt",
+        "cat input.txt | cat > output.txt",
+        "cat input.txt 2> errors.txt > output.txt",
+        "DEPOSITION_TEST=data sh -c 'echo $DEPOSITION_TEST' > output.txt",
+        "echo $DEPOSITION_TEST > output.txt",
+        "cat ~/input.txt > output.txt",
+        "cat inp*.txt > output.txt",
+        "echo `cat input.txt` > output.txt",
+        "printf '%.0sdata\\n' \">\" > output.txt",
+    ],
+)
+def test_run_command_redirection(tmp_path, monkeypatch, command):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("DEPOSITION_TEST", "data")
+    with open("input.txt", "w") as file:
+        file.write("data\n")
+    run_command(command)
+    with open("output.txt") as file:
+        assert file.read() == "data\n"
+
+
+def test_iteration_uses_given_state(tmp_path):
+    status = Status(1, 0, 0, str(tmp_path / "missing.pickle"))
+    state = State(np.zeros((1, 3)), ["C"], None)
+    iteration = Iteration(None, None, status, state)
+    assert iteration.state is state
+
+
+@pytest.mark.parametrize("success", [True, False])
+def test_restart_replaces_data_from_repeated_iteration(tmp_path, monkeypatch, success):
+    monkeypatch.chdir(tmp_path)
+    for name in ("current", "iterations/001", "failed/001"):
+        (tmp_path / name).mkdir(parents=True)
+    (tmp_path / "iterations" / "001" / "stale").touch()
+    (tmp_path / "failed" / "001" / "stale").touch()
+
+    status = Status(1, 0, 0, "initial_positions.pickle")
+    iteration = Iteration(None, None, status, State(np.zeros((1, 3)), ["C"], None))
+    iteration.success = success
+    iteration.finalisation()
+
+    destination = tmp_path / ("iterations" if success else "failed") / "001"
+    assert [path.name for path in destination.iterdir()] == ["deposition0001.pickle"]
+    assert not (tmp_path / ("failed" if success else "iterations") / "001").exists()
+    assert (tmp_path / "current").is_dir()
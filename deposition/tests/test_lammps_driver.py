@@ -0,0 +1,126 @@
+import os
+
+import numpy as np
+import pytest
+from pymatgen.io.lammps.data import LammpsData
+from schema import SchemaError
+
+from deposition import input_schema, utils
+from deposition.drivers.lammps_driver import LAMMPSDriver
+from deposition.drivers.molecular_dynamics_driver import MolecularDynamicsDriver
+from deposition.state import State
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), "test_data")
+
+SIMULATION_CELL = {"a": 10, "b": 10, "c": 50, "alpha": 90, "beta": 90, "gamma": 90}
+
+DRIVER_SETTINGS = {
+    "name": "LAMMPS",
+    "path_to_binary": os.path.join(TEST_DATA, "fake_binary"),
+    "path_to_input_template": os.path.join(TEST_DATA, "lammps_input_template.txt"),
+    "velocity_scaling_from_metres_per_second": 0.00001,
+    "timestep_scaling_from_picoseconds": 1000,
+    "elements_in_potential": "Al O",
+    "atomic_masses": [26.9815386, 15.9994],
+    "potential_file": os.path.join(TEST_DATA, "potential.reaxff"),
+    "temperature_of_system": 300,
+    "molecular_dynamics_timestep": 1.0,
+    "write_data_every_n_steps": 10,
+    "relaxation_time_picoseconds": 0.1,
+    "deposition_time_picoseconds": 0.4,
+}
+
+
+OUTPUT_DATA = """LAMMPS data file via write_data, version 29 Oct 2020, timestep = 100
+
+3 atoms
+2 atom types
+
+0 10 xlo xhi
+0 10 ylo yhi
+0 50 zlo zhi
+
+Masses
+
+1 26.9815386
+2 15.9994
+
+Atoms # charge
+
+2 1 0.5 1.0 1.0 2.0 0 0 0
+3 1 -0.5 2.0 2.0 3.0 0 0 0
+1 2 0.0 0.0 0.0 1.0 0 0 0
+
+Velocities
+
+2 0.0 0.0 0.0
+3 1.0 0.0 0.0
+1 0.0 0.0 -1.0
+"""
+
+
+def test_read_outputs(tmp_path):
+    filename = os.path.join(tmp_path, "deposition0001")
+    with open(f"{filename}.output_data", "w") as file:
+        file.write(OUTPUT_DATA)
+    state = LAMMPSDriver.read_outputs(filename)
+    assert state.elements == [2, 1, 1]
+    np.testing.assert_array_equal(
+        state.coordinates, [[0.0, 0.0, 1.0], [1.0, 1.0, 2.0], [2.0, 2.0, 3.0]]
+    )
+    np.testing.assert_array_equal(
+        state.velocities, [[0.0, 0.0, -1.0], [0.0, 0.0, 0.0], [1.0, 0.0, 0.0]]
+    )
+
+
+def test_write_inputs(tmp_path):
+    driver = LAMMPSDriver(
+        DRIVER_SETTINGS.copy(), utils.get_simulation_cell(SIMULATION_CELL)
+    )
+    elements = ["O", 1, "Al"]
+    state = State(
+        coordinates=np.array([[0.0, 0.0, 1.0], [1.0, 1.0, 2.0], [2.0, 2.0, 3.0]]),
+        elements=elements,
+        velocities=np.array([[0.0, 0.0, -1.0], [0.0, 0.0, 0.0], [1.0, 0.0, 0.0]]),
+    )
+    filename = os.path.join(tmp_path, "deposition0001")
+    driver.write_inputs(filename, state, "deposition")
+    assert state.elements is elements
+    assert "num_steps" not in driver.settings
+
+    data = LammpsData.from_file(f"{filename}.input_data", atom_style="charge")
+    assert data.atoms["type"].to_list() == [2, 1, 1]
+    np.testing.assert_allclose(data.atoms[["x", "y", "z"]], state.coordinates)
+    np.testing.assert_allclose(data.velocities, state.velocities)
+    with open(f"{filename}.input") as file:
+        assert "run 400\n" in file.read()
+
+
+def test_driver_does_not_modify_class_defaults():
+    reserved_keywords = list(MolecularDynamicsDriver._reserved_keywords)
+    schema_keys = set(MolecularDynamicsDriver._schema_dict)
+    driver = LAMMPSDriver(
+        DRIVER_SETTINGS.copy(), utils.get_simulation_cell(SIMULATION_CELL)
+    )
+    assert "num_steps" in driver.get_reserved_keywords()
+    assert MolecularDynamicsDriver._reserved_keywords == reserved_keywords
+    assert set(MolecularDynamicsDriver._schema_dict) == schema_keys
+
+
+def test_check_input_file_syntax():
+    driver = LAMMPSDriver(
+        DRIVER_SETTINGS.copy(), utils.get_simulation_cell(SIMULATION_CELL)
+    )
+    input_schema.check_input_file_syntax(driver)
+
+
+def test_check_input_file_syntax_mismatched_delimiters(tmp_path):
+    template_filename = os.path.join(tmp_path, "template.txt")
+    with open(template_filename, "w") as file:
+        file.write("read_data ${filename}.input_data\nrun ${num_steps\n")
+    driver = LAMMPSDriver(
+        {**DRIVER_SETTINGS, "path_to_input_template": template_filename},
+        utils.get_simulation_cell(SIMULATION_CELL),
+    )
+    with pytest.raises(SchemaError, match="incomplete variable"):
+        input_schema.check_input_file_syntax(driver)
@@ -0,0 +1,39 @@
+import numpy as np
+
+from deposition import physics
+
+
+def test_velocity_from_normal_distribution_scalar():
+    assert type(physics.velocity_from_normal_distribution(300.0, 1e-25)) is float
+    assert physics.velocity_from_normal_distribution(300.0, 0.0) == 0.0
+
+
+def test_velocity_from_normal_distribution_array():
+    masses = np.array([1e-25, 0.0, 1e-25])
+    velocities = physics.velocity_from_normal_distribution(300.0, masses)
+    assert velocities.shape == (3,)
+    assert velocities[1] == 0.0
+
+
+def test_centre_of_mass_and_moment_of_inertia():
+    coordinates = [[0.0, 0.0, 0.0], [0.0, 0.0, 2.0], [1.0, 0.0, 0.0]]
+    elements = ["C", "C", "H"]
+    centre_of_mass, masses = physics.get_centre_of_mass(coordinates, elements)
+    expected = np.sum(masses[:, None] * np.array(coordinates), axis=0) / masses.sum()
+    assert np.allclose(centre_of_mass, expected)
+    assert masses[0] == masses[1] > masses[2]
+
+    moment_of_inertia = physics.get_moment_of_inertia(coordinates, elements)
+    distances = np.abs(np.array(coordinates) - centre_of_mass)
+    assert np.allclose(moment_of_inertia, (masses[:, None] * distances).sum(axis=0))
+    assert moment_of_inertia[1] == 0.0
+
+
+def test_seed_rng_reproduces_velocities():
+    masses = np.array([1e-25, 2e-25, 3e-25])
+    physics.seed_rng(42)
+    velocities = physics.velocity_from_normal_distribution(300.0, masses)
+    physics.seed_rng(42)
+    assert np.array_equal(
+        velocities, physics.velocity_from_normal_distribution(300.0, masses)
+    )
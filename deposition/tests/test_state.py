@@ -0,0 +1,44 @@
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from deposition.state import State
+
+NUM_ATOMS = 5
+
+TEST_STATE = State(
+    coordinates=np.random.uniform(0, 10, (NUM_ATOMS, 3)),
+    elements=["Al", "O", "O", "Al", "O"],
+    velocities=np.random.normal(0, 1, (NUM_ATOMS, 3)),
+)
+
+
+@pytest.mark.parametrize("include_velocities", [True, False])
+def test_state_round_trip(tmp_path, include_velocities):
+    filename = os.path.join(tmp_path, "state.pickle")
+    TEST_STATE.write(filename, include_velocities=include_velocities)
+    result = State.read_state(filename)
+    np.testing.assert_array_equal(result.coordinates, TEST_STATE.coordinates)
+    assert result.elements == TEST_STATE.elements
+    if include_velocities:
+        np.testing.assert_array_equal(result.velocities, TEST_STATE.velocities)
+    else:
+        assert result.velocities is None
+
+
+def test_read_legacy_pickle(tmp_path):
+    filename = os.path.join(tmp_path, "state.pickle")
+    with open(filename, "wb") as file:
+        pickle.dump(
+            {
+                "state": TEST_STATE.coordinates,
+                "elements": TEST_STATE.elements,
+                "velocities": None,
+            },
+            file,
+        )
+    result = State.read_state(filename)
+    np.testing.assert_array_equal(result.coordinates, TEST_STATE.coordinates)
+    assert result.elements == TEST_STATE.elements
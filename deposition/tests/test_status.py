@@ -0,0 +1,26 @@
+import os
+
+from deposition.status import Status
+
+
+def test_status_round_trip(tmp_path):
+    filename = os.path.join(tmp_path, "status.yaml")
+    status = Status(
+        iteration_number=3,
+        sequential_failures=1,
+        total_failures=2,
+        pickle_location="iterations/002/deposition002.pickle",
+    )
+    status.write(filename)
+    result = Status.from_file(filename)
+    assert result.as_dict() == status.as_dict()
+
+
+def test_status_write_leaves_no_temporary_files(tmp_path):
+    filename = os.path.join(tmp_path, "status.yaml")
+    status = Status(1, 0, 0, "initial_positions.pickle")
+    status.write(filename)
+    status.iteration_number += 1
+    status.write(filename)
+    assert os.listdir(tmp_path) == ["status.yaml"]
+    assert Status.from_file(filename).iteration_number == 2
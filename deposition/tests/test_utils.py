@@ -0,0 +1,21 @@
+import numpy as np
+
+from deposition import utils
+
+SIMULATION_CELL = {
+    "a": 10.0,
+    "b": 12.0,
+    "c": 30.0,
+    "alpha": 90.0,
+    "beta": 90.0,
+    "gamma": 90.0,
+}
+
+
+def test_neighbour_list_matches_general_search():
+    coordinates = np.random.default_rng(0).uniform(-5, 35, (200, 3))
+    # a negligible change to the angle forces the general pymatgen search
+    nearly_orthogonal_cell = dict(SIMULATION_CELL, alpha=89.99999)
+    assert utils.generate_neighbour_list(
+        SIMULATION_CELL, coordinates, 3.0
+    ) == utils.generate_neighbour_list(nearly_orthogonal_cell, coordinates, 3.0)
@@ -4,10 +4,11 @@ import numpy as np
 from pymatgen.core import IStructure, PeriodicSite
 from pymatgen.core.lattice import Lattice
 from pymatgen.io.lammps.data import lattice_2_lmpbox
+from scipy.spatial import cKDTree
 
 from deposition import input_schema
-from deposition.drivers.driver_enums import DriverEnum
-from deposition.enums import SettingsEnum
+from deposition.drivers import get_driver
+from deposition.enums import SettingsEnum, SimulationCellEnum
 
 
 def get_simulation_cell(simulation_cell):
@@ -79,17 +80,7 @@ def get_molecular_dynamics_driver(
     """
     driver_name = driver_settings["name"]
 
-    try:
-        driver_class = DriverEnum[driver_name].value
-    except KeyError:
-        raise ValueError(f"no driver with the name '{driver_name}' was found")
-
-    # for driver in DriverEnum:
-    #     if driver_name == driver.name:
-    #         driver_class = driver.value
-    #         break
-    # else:
-    #     raise ValueError(f"no driver with the name '{chosen_driver}' was found")
+    driver_class = get_driver(driver_name)
 
     simulation_cell_full = get_simulation_cell(simulation_cell)
     driver = driver_class(driver_settings, simulation_cell_full)
@@ -111,6 +102,10 @@ def generate_neighbour_list(simulation_cell, coordinates, bonding_distance_cutof
     Create a neighbour list for the current state to check for isolated atoms
     or molecules.
 
+    Orthogonal cells which are at least twice the cutoff in each direction use a
+    periodic k-d tree from `scipy`, other cells fall back to the general neighbour
+    search in `pymatgen`.
+
     Arguments:
         simulation_cell (dict): specification of the size and shape of the simulation
         cell
@@ -121,6 +116,28 @@ def generate_neighbour_list(simulation_cell, coordinates, bonding_distance_cutof
     Returns:
         neighbour_list (list): list of integers counting the neighbours of each atom
     """
+    angles = [
+        simulation_cell[SimulationCellEnum.ALPHA.value],
+        simulation_cell[SimulationCellEnum.BETA.value],
+        simulation_cell[SimulationCellEnum.GAMMA.value],
+    ]
+    box = np.array(
+        [
+            simulation_cell[SimulationCellEnum.A.value],
+            simulation_cell[SimulationCellEnum.B.value],
+            simulation_cell[SimulationCellEnum.C.value],
+        ],
+        dtype=float,
+    )
+    if np.allclose(angles, 90.0) and np.all(box > 2 * bonding_distance_cutoff):
+        wrapped = np.mod(coordinates, box)
+        wrapped[wrapped >= box] = 0.0  # guard against rounding up to the boundary
+        tree = cKDTree(wrapped, boxsize=box)
+        neighbours = tree.query_ball_point(
+            wrapped, bonding_distance_cutoff, return_length=True
+        )
+        return [int(count) - 1 for count in neighbours]  # exclude the atom itself
+
     lattice = Lattice.from_parameters(**simulation_cell)
     fake_elements = ["X" for _ in range(len(coordinates))]
     sites = [
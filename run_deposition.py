@@ -7,7 +7,9 @@ from deposition.settings import Settings
 
 
 @click.command()
-@click.option("--settings", "filename", required=True, type=click.Path(exists=True))
+@click.option(
+    "--settings", "settings_filename", required=True, type=click.Path(exists=True)
+)
 def main(settings_filename):
     """
     Run the deposition calculation from the command line.
@@ -20,7 +22,7 @@ def main(settings_filename):
     Returns:
         exit_code (int): a code relating to the reason for the termination of the calculation
     """
-    settings = Settings.from_file(settings_filename).as_dict()
+    settings = Settings.from_file(settings_filename)
     calculation = deposition.Deposition(settings)
     return calculation.run()
 
@@ -24,6 +24,7 @@ setup(
         "pymatgen>=2022.0.8",
         "PyYAML>=5.4.1",
         "schema>=0.7.4",
+        "scipy>=1.6.0",
         "Sphinx>=4.2.0",
     ],
 )